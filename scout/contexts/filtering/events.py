@@ -5,14 +5,88 @@ Implements broadcast-subscribe pattern via log files.
 Filtering context produces events, storage context consumes them.
 """
 
-import json
+import atexit
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+from scout.utils.helpers import json_dumps_bytes
+
 load_dotenv()
 LOGS_PATH = Path(os.getenv("LOGS_PATH", "outs/logs"))
+EVENT_LOG_FILENAME = "listing_status_changed.txt"
+
+
+class StatusEventLogger:
+    """
+    Append listing status-change events to the event log through one long-lived handle.
+
+    The log file is opened lazily on the first event and kept open with a large write
+    buffer, so logging an event costs no open/close syscalls. Events reach the disk when
+    the buffer fills, on flush(), or at interpreter exit. Safe to use from several threads.
+    """
+
+    def __init__(self, log_dir: Path = LOGS_PATH, buffer_size: int = 1 << 16):
+        """
+        Args:
+            log_dir: Directory for log files (default: LOGS_PATH from environment)
+            buffer_size: Size in bytes of the file write buffer
+        """
+        self.log_path = Path(log_dir) / EVENT_LOG_FILENAME
+        self.buffer_size = buffer_size
+        self._handle = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        # Ensure log directory exists (once, not per event)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.log_path, "ab", buffering=self.buffer_size)
+        atexit.register(self.close)
+
+    def log(self, url: str, old_status: str, new_status: str, database: str) -> None:
+        """Write one status-change event (see log_status_event for the format)."""
+        event = {
+            "timestamp": datetime.now().isoformat(),
+            "database": database,
+            "url": url,
+            "old_status": old_status,
+            "new_status": new_status,
+        }
+        # Using JSON Lines format with one JSON object per line (already UTF-8 bytes)
+        line = json_dumps_bytes(event) + b"\n"
+
+        with self._lock:
+            if self._handle is None:
+                self._open()
+            self._handle.write(line)
+
+    def flush(self) -> None:
+        """Push buffered events to the log file."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self) -> None:
+        """Flush and close the log file (reopened automatically by the next event)."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+_event_loggers: dict[Path, StatusEventLogger] = {}
+_event_loggers_lock = threading.Lock()
+
+
+def get_status_event_logger(log_dir: Path = LOGS_PATH) -> StatusEventLogger:
+    """Return the process-wide StatusEventLogger for log_dir (one open handle per log file)."""
+    log_dir = Path(log_dir)
+    with _event_loggers_lock:
+        if log_dir not in _event_loggers:
+            _event_loggers[log_dir] = StatusEventLogger(log_dir)
+        return _event_loggers[log_dir]
 
 
 def log_status_event(
@@ -30,6 +104,8 @@ def log_status_event(
     The storage context will handle these events with its maintenance.py
 
     Currently implemented statuses are 'active', 'inactive', and 'unknown'.
+    The event is flushed immediately; log through get_status_event_logger() and flush
+    once at the end to batch many events.
 
     Args:
         url: Unique identifier for the listing
@@ -38,22 +114,6 @@ def log_status_event(
         database: Database name where the listing resides
         log_dir: Directory for log files (default: LOGS_PATH from environment)
     """
-    # Ensure log directory exists
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
-
-    # Construct event
-    event = {
-        "timestamp": datetime.now().isoformat(),
-        "database": database,
-        "url": url,
-        "old_status": old_status,
-        "new_status": new_status,
-    }
-
-    # Append to log file (generic name for all status changes)
-    # Using JSON Lines format with one JSON object per line
-    log_file = log_path / "listing_status_changed.txt"
-
-    with open(log_file, "a") as f:
-        f.write(json.dumps(event) + "\n")
+    event_logger = get_status_event_logger(log_dir)
+    event_logger.log(url, old_status, new_status, database)
+    event_logger.flush()
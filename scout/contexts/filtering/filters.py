@@ -4,12 +4,50 @@ Provides functions to filter job listings based on various criteria.
 """
 
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+from urllib.parse import urlsplit
+
+import numpy as np
 import pandas as pd
 
-from scout.utils.text_processing import check_keyword_between_delimiters
-from scout.contexts.filtering.events import log_status_event
-from scout.contexts.scraping.requests import URLFetcher, LINK_GOOD, LINK_BAD, LINK_UNKNOWN
+from scout.contexts.filtering.events import get_status_event_logger
+from scout.contexts.scraping.requests import HostThrottle, URLFetcher, LINK_GOOD, LINK_BAD, LINK_UNKNOWN
+
+
+class _HostCircuitBreaker:
+    """
+    Stop probing a host for a cooldown window after repeated transient failures (thread-safe).
+
+    A host that keeps timing out or answering 5xx would otherwise cost a full timeout for every
+    one of its URLs; while its breaker is open, those URLs are classified as unknown instead.
+    """
+
+    def __init__(self, max_failures: int = 3, cooldown: float = 60.0):
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self._failure_counts = {}
+        self._open_until = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, url: str) -> bool:
+        host = urlsplit(url).netloc
+        with self._lock:
+            return time.monotonic() < self._open_until.get(host, 0.0)
+
+    def record(self, url: str, classification: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if classification != LINK_UNKNOWN:
+                self._failure_counts[host] = 0
+                return
+
+            self._failure_counts[host] = self._failure_counts.get(host, 0) + 1
+            if self._failure_counts[host] >= self.max_failures:
+                self._open_until[host] = time.monotonic() + self.cooldown
+                self._failure_counts[host] = 0
 
 
 def check_active(
@@ -17,7 +55,8 @@ def check_active(
     database_name: str,
     url_column: str = "url",
     status_column: str = "Status",
-    fetcher: URLFetcher = None
+    fetcher: URLFetcher = None,
+    max_workers: int = 8,
 ) -> pd.DataFrame:
     """
     Check if job listing URLs are still active and log status changes.
@@ -27,30 +66,67 @@ def check_active(
     - Logs events when status changes
     - Does not update database
 
+    URLs are probed concurrently by a thread pool (network waits overlap), while requests
+    to the same host are still spaced out to be polite. Probes use HEAD requests since only
+    the status code and final (redirected) URL are needed, not the page body.
+    Duplicate URLs are probed once, and a host that fails transiently several times in a row
+    is skipped (classified as unknown) for a cooldown window. Listings whose status is already
+    'inactive' are not probed at all (a dead listing doesn't come back to life).
+
     Args:
         df: DataFrame containing job listings
         database_name: Name of database these listings belong to (for event logging)
         url_column: Name of column containing URLs to check (default: "url")
         status_column: Name of column with current status (expected: "Status")
         fetcher: URLFetcher instance to use (creates new one if None)
+        max_workers: Maximum number of concurrent HTTP probes (default: 8)
 
     Returns:
-        DataFrame with new "Inactive" boolean column added
+        DataFrame with new "Inactive" column added (nullable boolean: True, False, or <NA>
+        when the URL's status is unknown)
     """
-    inactives = []
-    has_status_column = status_column in df.columns
+    inactives = np.empty(len(df), dtype=object)
 
     if fetcher is None:
         fetcher = URLFetcher(max_consecutive_failures=999, request_delay=0.5, max_retries=1)
 
-    for _, row in df.iterrows():
-        url = row[url_column]
-
-        # If column doesn't exist, assumes a status of 'unknown'
-        old_status = row[status_column] if has_status_column else 'unknown'
-
-        _, classification, _ = fetcher.fetch(url)
-
+    host_throttle = HostThrottle(min_interval=0.5)  # Be "polite"
+    host_breaker = _HostCircuitBreaker(max_failures=3, cooldown=60.0)
+
+    def probe(url):
+        if host_breaker.is_open(url):
+            return LINK_UNKNOWN
+
+        host_throttle.wait(url)
+        if host_breaker.is_open(url):  # May have tripped while waiting for our slot
+            return LINK_UNKNOWN
+
+        _, classification, _ = fetcher.fetch(url, method="HEAD", allow_redirects=True)
+        host_breaker.record(url, classification)
+        return classification
+
+    # Materialize the needed columns once; iterating ndarrays avoids building a Series per row
+    urls = df[url_column].to_numpy()
+    if status_column in df.columns:
+        old_statuses = df[status_column].to_numpy()
+    else:
+        old_statuses = ['unknown'] * len(df)  # If column doesn't exist, assumes a status of 'unknown'
+
+    # Known-inactive listings keep their status without a network round trip
+    needs_probe = pd.Series(old_statuses).ne('inactive').to_numpy()
+
+    unique_urls = pd.unique(urls[needs_probe])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        url_classifications = dict(zip(unique_urls, executor.map(probe, unique_urls)))
+    classifications = [
+        url_classifications[url] if probed else LINK_BAD
+        for url, probed in zip(urls, needs_probe)
+    ]
+
+    # Status comparison and event logging stay on the calling thread.
+    # Events are buffered by the shared logger and flushed once at the end.
+    event_logger = get_status_event_logger()
+    for i, (url, old_status, classification) in enumerate(zip(urls, old_statuses, classifications)):
         if classification == LINK_GOOD:
             new_status = 'active'
         elif classification == LINK_BAD:
@@ -59,49 +135,103 @@ def check_active(
             new_status = 'unknown'
 
         if new_status != old_status:
-            log_status_event(url, old_status, new_status, database_name)
+            event_logger.log(url, old_status, new_status, database_name)
 
         inactive_status_bool_map = {"active": False, "inactive": True, "unknown": None}
-        inactives.append(inactive_status_bool_map[new_status])
+        inactives[i] = inactive_status_bool_map[new_status]
 
-        time.sleep(0.5)  # Be "polite"
+    event_logger.flush()
 
-    df["Inactive"] = inactives
+    df["Inactive"] = pd.array(inactives, dtype="boolean")
     return df
 
+def _trie_regex(node: dict) -> str:
+    """
+    Render a character trie as a regex where shared prefixes are matched only once.
+
+    An empty-string key marks the end of a keyword. Longer keywords that extend a complete
+    keyword are dropped, since the shorter one already flags the text.
+    """
+    if "" in node:
+        return ""
+
+    alternatives = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items())]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+def compile_red_flag_pattern(red_flags: list, case_sensitive: bool = True) -> re.Pattern:
+    """
+    Compile red flag keywords into a single pattern matching any of them literally.
+
+    Keywords are merged into a prefix trie (Aho-Corasick style) before compiling, so the regex
+    engine walks shared prefixes once per position instead of retrying every keyword.
+    An empty list compiles to a pattern that never matches (no red flags to find).
+
+    Case-insensitive patterns use re.IGNORECASE, so the text is never lowercased row by row.
+    """
+    if not red_flags:
+        return re.compile("(?!)")
+
+    if not case_sensitive:
+        # Lowercase keywords so "Manager" and "manager" share one trie branch
+        red_flags = [flag.lower() for flag in red_flags]
+
+    trie = {}
+    for flag in red_flags:
+        node = trie
+        for char in flag:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return re.compile(_trie_regex(trie), 0 if case_sensitive else re.IGNORECASE)
+
+
 def check_column_red_flags(
     df: pd.DataFrame,
-    red_flags: list,
+    red_flags: Union[list, re.Pattern],
     column: str,
-    output_column: str = None
+    output_column: str = None,
+    inplace: bool = False,
+    case_sensitive: bool = True,
 ) -> pd.DataFrame:
     """
     Check any column for undesirable keywords (generic red flag filter).
 
     Args:
         df: DataFrame containing job listings
-        red_flags: List of keywords to flag (e.g., ["Manager",])
+        red_flags: List of keywords to flag (e.g., ["Manager",]), or a pattern
+                   precompiled with compile_red_flag_pattern()
         column: Name of column to check for red flags (e.g., "Job Title")
         output_column: Name of output boolean column (default: "{column}_OK")
+        inplace: If True, add the column to df itself instead of to a shallow copy
+                 (for callers that own df, e.g. FilterPipeline)
+        case_sensitive: If False, keywords match regardless of case (ignored when red_flags
+                        is a precompiled pattern)
 
     Returns:
         DataFrame with new boolean column (True if no red flags found)
     """
-    # Work with a copy to avoid SettingWithCopyWarning
-    df = df.copy()
+    if not inplace:
+        # Shallow copy: adding a column doesn't need the existing column data duplicated
+        # (also clears pandas' "is a slice" flag, avoiding SettingWithCopyWarning)
+        df = df.copy(deep=False)
 
     if output_column is None:
         # Sanitize column name for output (remove spaces, special chars)
         sanitized_column = column.replace(" ", "_").replace("-", "_")
         output_column = f"{sanitized_column}_OK"
 
-    red_flag_bool_col = []
+    if isinstance(red_flags, re.Pattern):
+        red_flag_pattern = red_flags
+    else:
+        red_flag_pattern = compile_red_flag_pattern(red_flags, case_sensitive=case_sensitive)
 
-    for _, row in df.iterrows():
-        has_red_flag = any(flag in row[column] for flag in red_flags)
-        red_flag_bool_col.append(not has_red_flag)
+    # One vectorized scan over an alternation of the (literal) flags instead of a per-row loop
+    has_red_flag = df[column].astype("string").str.contains(red_flag_pattern, na=False)
 
-    df[output_column] = red_flag_bool_col
+    df[output_column] = ~has_red_flag.astype(bool)
     return df
 
 
@@ -135,19 +265,29 @@ def check_clearance_req(
 ) -> pd.DataFrame:
     """
     Check if cearance is a required qualification (not robustly implemented yet)
+
+    Vectorized equivalent of check_keyword_between_delimiters() applied to every row:
+    extract the text between the delimiters, then search it for "clearance".
+    Only descriptions that mention "clearance" at all are sectioned, since the section can't
+    contain the keyword otherwise.
     """
-    clearance_required_list = []
+    descriptions = df[description_column]
+
+    # Cheap literal prefilter; most descriptions never mention clearance
+    mentions_clearance = descriptions.str.contains("clearance", case=False, na=False).astype(bool)
+    candidates = descriptions[mentions_clearance]
 
-    for i, row in df.iterrows():
-        clearance_required = check_keyword_between_delimiters(
-            row[description_column],
-            "clearance",  # Case-insensitive search (regex uses re.IGNORECASE)
-            start_delimiter,
-            end_delimiter,
-        )
-        clearance_required_list.append(clearance_required)
+    # Same pattern as check_keyword_between_delimiters: DOTALL, non-greedy, literal delimiters
+    section_pattern = f"(?s){re.escape(start_delimiter)}(.*?){re.escape(end_delimiter)}"
+    section = candidates.str.extract(section_pattern, expand=False)
+
+    # Case-insensitive search for keyword; rows without both delimiters have no section
+    clearance_required = pd.Series(False, index=df.index)
+    clearance_required[mentions_clearance] = (
+        section.str.contains("clearance", case=False, na=False).astype(bool).to_numpy()
+    )
 
-    df["Clearance Required"] = clearance_required_list
+    df["Clearance Required"] = clearance_required
     return df
 
 
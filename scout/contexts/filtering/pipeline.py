@@ -4,9 +4,10 @@ Job filtering pipeline with configuration support.
 Provides FilterPipeline class for consolidated filtering controlled by YAML config.
 """
 import os
-from datetime import datetime, timedelta
+import re
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Tuple, Union
 
 import pandas as pd
 from dotenv import load_dotenv
@@ -17,11 +18,19 @@ from scout.contexts.filtering.filters import (
     check_active,
     check_clearance_req,
     check_column_red_flags,
+    compile_red_flag_pattern,
 )
 from scout.contexts.scraping.requests import URLFetcher
 
 load_dotenv()
-CONFIG_PATH = Path(os.getenv("CONFIG_PATH"))
+CONFIG_PATH = Path(os.getenv("CONFIG_PATH", "config"))
+
+
+def _like_substring_patterns(values: List[str]) -> List[str]:
+    """Build LIKE patterns matching each value anywhere in a string (LIKE wildcards escaped)."""
+    escaped = (value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") for value in values)
+    return [f"%{value}%" for value in escaped]
+
 
 class FilterPipeline:
     """
@@ -61,43 +70,69 @@ class FilterPipeline:
 
         self.fetcher = URLFetcher(max_consecutive_failures=50, request_delay=0.5, max_retries=1)
 
-    def build_sql_query(self, table_name: str = "listings") -> str:
+        # Compiled regexes reused across apply_filters() calls, keyed by (column, keywords)
+        self._regex_cache: dict[tuple, re.Pattern] = {}
+
+        # Generated SQL reused across build_sql_query() calls, keyed by (table, today's date)
+        self._sql_query_cache: dict[tuple, Tuple[str, Dict[str, Any]]] = {}
+
+    def build_sql_query(self, table_name: str = "listings") -> Tuple[str, Dict[str, Any]]:
         """
         Generate SQL WHERE clause from configuration.
 
+        Config values are never interpolated into the SQL text; they are returned as bound
+        parameters (psycopg2 "pyformat" style) to pass along with the query.
+        The result is cached per table for the current day (the age cutoff rolls over daily).
+
         Args:
             table_name: Name of database table to query
 
         Returns:
-            Complete SQL SELECT query with WHERE conditions
+            Tuple of (complete SQL SELECT query with WHERE conditions, query parameters)
+
+        Example:
+            >>> query, params = pipeline.build_sql_query()
+            >>> df = scraper.import_db_as_df(query=query, params=params)
         """
+        cache_key = (table_name, date.today())
+        if cache_key not in self._sql_query_cache:
+            self._sql_query_cache[cache_key] = self._generate_sql_query(table_name, cutoff_day=cache_key[1])
+
+        query, params = self._sql_query_cache[cache_key]
+        return query, dict(params)  # Copy so callers can't alter the cached parameters
+
+    def _generate_sql_query(self, table_name: str, cutoff_day: date) -> Tuple[str, Dict[str, Any]]:
+        """Build the query and parameters for build_sql_query() (uncached)."""
         sql_config = self.config.sql_filters
 
         conditions = []
+        params = {}
 
         # Salary filter
         if sql_config.min_salary: # No filter if 0 is used
-            conditions.append(
-                f"( max_salary >= {sql_config.min_salary} OR max_salary = 0 )"
-            )
+            conditions.append("( max_salary >= %(min_salary)s OR max_salary = 0 )")
+            params["min_salary"] = sql_config.min_salary
 
         # Date filter
         if sql_config.max_age_days: # No filter if 0 is used
-            cutoff_date = (datetime.today() - timedelta(days=sql_config.max_age_days)).date()
-            conditions.append(f"( date_posted >= '{cutoff_date}' )")
+            cutoff_date = cutoff_day - timedelta(days=sql_config.max_age_days)
+            conditions.append("( date_posted >= %(cutoff_date)s )")
+            params["cutoff_date"] = cutoff_date
 
         # Location filter (state codes OR remote)
         if sql_config.onsite_locations or sql_config.remote or sql_config.hybrid_locations:
             location_conditions = []
 
+            # One LIKE ANY(array) predicate per location group instead of a chain of ORed LIKEs
             if sql_config.onsite_locations:
-                onsite_clause = " OR ".join([f"location LIKE '%{loc}%'" for loc in sql_config.onsite_locations])
-                location_conditions.append(f" ( {onsite_clause} ) ")
+                location_conditions.append("( location LIKE ANY(%(onsite_locations)s) )")
+                params["onsite_locations"] = _like_substring_patterns(sql_config.onsite_locations)
 
             if sql_config.hybrid_locations:
-                hybrid_clause = " OR ".join([f"location LIKE '%{loc}%'" for loc in sql_config.hybrid_locations])
-                hybrid_clause = f"( {hybrid_clause} ) AND remote = 'Hybrid'"
-                location_conditions.append(f" ( {hybrid_clause} ) ")
+                location_conditions.append(
+                    "( location LIKE ANY(%(hybrid_locations)s) AND remote = 'Hybrid' )"
+                )
+                params["hybrid_locations"] = _like_substring_patterns(sql_config.hybrid_locations)
 
             if sql_config.remote:
                 location_conditions.append("( remote = 'Yes' )")
@@ -108,9 +143,8 @@ class FilterPipeline:
 
         # Status filter
         if sql_config.get("status_filter", False):
-            conditions.append(
-                f"(status = '{sql_config.status_filter}' OR status IS NULL)"
-            )
+            conditions.append("(status = %(status_filter)s OR status IS NULL)")
+            params["status_filter"] = sql_config.status_filter
 
         # Build complete query
         where_clause = " AND ".join(conditions)
@@ -118,7 +152,7 @@ class FilterPipeline:
         if where_clause:
             query += f" WHERE {where_clause}"
 
-        return query
+        return query, params
 
     def apply_filters(self, df: pd.DataFrame, database_name: str = None, verbose: bool = True) -> pd.DataFrame:
         """
@@ -137,23 +171,30 @@ class FilterPipeline:
         if verbose:
             print(f"Starting with {initial_count} jobs")
 
+        # The cheap vectorized filters below only build boolean masks over the full frame;
+        # rows are dropped once, with the combined mask, instead of copying df after every step
+        df = df.copy(deep=False)  # Owned by the pipeline from here, so columns are added in place
+        keep = pd.Series(True, index=df.index)
+
         # Keyword filters
         if self.config.keyword_filters.required_keywords:
             keywords = self.config.keyword_filters.required_keywords
             desc_col = self.config.keyword_filters.description_column
 
-            keyword_pattern = "|".join(keywords)
-            white_list_mask = df[desc_col].str.contains(keyword_pattern, case=False, na=False)
-            df = df[white_list_mask]
+            cache_key = (desc_col, tuple(keywords))
+            if cache_key not in self._regex_cache:
+                self._regex_cache[cache_key] = re.compile("|".join(keywords), re.IGNORECASE)
+            keep &= df[desc_col].str.contains(self._regex_cache[cache_key], na=False).astype(bool)
 
             if verbose:
-                print(f"After keyword filtering: {len(df)} jobs")
+                print(f"After keyword filtering: {keep.sum()} jobs")
 
         # Red flag filtering (generic, applies to any column)
         if hasattr(self.config, 'red_flags') and self.config.red_flags:
             for filter_config in self.config.red_flags:
                 column = filter_config.column
                 flags = filter_config.flags
+                case_sensitive = filter_config.get('case_sensitive', True)
 
                 if filter_config.get('bool_out_column'):
                     output_col = filter_config.bool_out_column
@@ -162,17 +203,22 @@ class FilterPipeline:
                     sanitized_column = column.replace(" ", "_").replace("-", "_")
                     output_col = f"{sanitized_column}_OK"
 
+                cache_key = (column, tuple(flags), case_sensitive)
+                if cache_key not in self._regex_cache:
+                    self._regex_cache[cache_key] = compile_red_flag_pattern(flags, case_sensitive=case_sensitive)
+
                 df = check_column_red_flags(
                     df,
-                    red_flags=flags,
+                    red_flags=self._regex_cache[cache_key],
                     column=column,
-                    output_column=output_col
+                    output_column=output_col,
+                    inplace=True,
                 )
 
-                df = df[df[output_col]]
+                keep &= df[output_col]
 
                 if verbose:
-                    print(f"After '{column}' red flag filtering: {len(df)} jobs")
+                    print(f"After '{column}' red flag filtering: {keep.sum()} jobs")
 
         # Clearance requirement
         if self.config.get("clearance", False):
@@ -184,10 +230,12 @@ class FilterPipeline:
                     start_delimiter=clearance_config.start_delimiter,
                     end_delimiter=clearance_config.end_delimiter,
                 )
-                df = df[~df["Clearance Required"]]
+                keep &= ~df["Clearance Required"]
 
                 if verbose:
-                    print(f"After clearance filtering: {len(df)} jobs")
+                    print(f"After clearance filtering: {keep.sum()} jobs")
+
+        df = df[keep]
 
         # Active URL check (slow, optional)
         active_config = self.config.active_check
@@ -201,7 +249,7 @@ class FilterPipeline:
                 url_column=active_config.url_column,
                 fetcher=self.fetcher
             )
-            df = df[~df["Inactive"]]
+            df = df[~df["Inactive"].fillna(False)]  # Keep listings whose status is unknown
 
             if verbose:
                 print(f"After activity check: {len(df)} jobs")
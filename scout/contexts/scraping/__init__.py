@@ -11,6 +11,7 @@ from scout.contexts.scraping.base import (
 )
 from scout.contexts.scraping.requests import (
     html_request_with_retry,
+    new_session,
     URLFetcher,
     NetworkCircuitBreakerException,
     classify_http_outcome,
@@ -25,6 +26,7 @@ __all__ = [
     "HTMLScraper",
     "APIScraper",
     "html_request_with_retry",
+    "new_session",
     "URLFetcher",
     "NetworkCircuitBreakerException",
     "classify_http_outcome",
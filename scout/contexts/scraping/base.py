@@ -8,24 +8,36 @@ This module defines the abstract base classes and common functionality for all j
 """
 
 import os
-import json
 import time
+import inspect
+import multiprocessing
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
+import lxml.html
+from bs4 import BeautifulSoup
 from tqdm import tqdm
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from sqlalchemy import create_engine
 from typing import List, Dict, Tuple
 from omegaconf import OmegaConf
 from dotenv import load_dotenv
 
+try:
+    import zstandard
+except ImportError:  # Optional speedup: pip install -e ".[speedups]"
+    zstandard = None
+
 from scout.contexts.storage import (
     get_database_wrapper,
     DatabaseConfig,
 )
+from scout.utils import json_dumps_bytes, json_loads, use_arrow_strings
 
 load_dotenv()
 CONFIG_PATH = Path(os.getenv("CONFIG_PATH", "config"))
@@ -40,8 +52,82 @@ FAILURE_STATUS = "failed"
 TEMP_STATUS = "pending"
 TEMP_FAILURE_STATUS = "temp_failure"
 
+# Cache files whose path ends in this suffix are written zstd-compressed
+ZSTD_SUFFIX = ".zst"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"  # First bytes of every zstd frame
+
+
+@lru_cache(maxsize=8)
+def _read_cache_file(cache_path, mtime_ns, size):
+    """
+    Parse a JSON cache file, memoized by path and file stat.
+
+    Scrapers constructed repeatedly on an unchanged cache file (tests, notebooks, orchestration)
+    skip re-parsing it; a rewritten file has a new stat and is read again.
+    The result is shared between callers and must be treated as read-only.
+    Compressed files are recognised by their zstd frame header, so plain JSON caches keep loading.
+    A damaged file (bad JSON, or a corrupt or truncated zstd frame) raises ValueError.
+    """
+    with open(cache_path, "rb") as f:
+        content = f.read()
+    if content.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ImportError(f"{cache_path} is zstd-compressed; install zstandard (pip install -e \".[speedups]\").")
+        try:
+            content = zstandard.ZstdDecompressor().decompressobj().decompress(content)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"corrupt zstd data: {e}") from e
+    return json_loads(content)
+
+
+def _cache_journal_path(cache_path) -> str:
+    """Append-only JSON Lines file next to a cache file, e.g. acme.json (or acme.json.zst) -> acme.jsonl."""
+    return f"{str(cache_path).removesuffix(ZSTD_SUFFIX)}l"
+
+
+def _read_cache_journal(journal_path) -> Tuple[Dict[str, dict], int, bool]:
+    """
+    Read journaled cache updates: (URL -> entry with later lines winning, entries read, damaged?).
+
+    A partially written line (e.g. from a crash mid-append, even one torn inside a multibyte
+    character) or any other line that isn't a cache entry is skipped and flags the journal damaged.
+    """
+    journaled_data = {}
+    line_count = 0
+    is_damaged = False
+    with open(journal_path, "rb") as f:
+        for line in f:
+            try:
+                entry = json_loads(line)
+            except ValueError:  # Includes UnicodeDecodeError
+                entry = None
+            if not isinstance(entry, dict) or "url" not in entry:
+                is_damaged = True
+                continue
+            journaled_data[entry.pop("url")] = entry
+            line_count += 1
+    return journaled_data, line_count, is_damaged
+
+
+def _map_ahead(executor, fn, items, window):
+    """
+    Like executor.map(fn, items), but with at most `window` calls submitted ahead of the consumer.
+
+    Results are still yielded in order; bounding the look-ahead keeps a slow consumer (e.g.
+    HTML parsing) from buffering every downloaded page of a large batch in memory.
+    """
+    items = iter(items)
+    pending = deque(executor.submit(fn, item) for item in islice(items, window))
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(items, 1):
+            pending.append(executor.submit(fn, item))
+        yield result
+
 from scout.contexts.scraping.requests import (
+    HostThrottle,
     URLFetcher,
+    new_session,
     NetworkCircuitBreakerException,
     LINK_GOOD,
     LINK_BAD,
@@ -60,6 +146,9 @@ class JobListingScraper(ABC):
     - Orchestration (batch processing, retry logic)
     """
 
+    # Listings buffered across batches before being appended to the database in one go
+    archive_flush_rows = 5000
+
     def __init__(
         self,
         df2db_col_map,
@@ -84,13 +173,16 @@ class JobListingScraper(ABC):
             max_consecutive_failures=self.fetch_config.max_consecutive_failures,
             request_delay=self.fetch_config.request_delay,
             max_retries=self.fetch_config.max_retries,
+            # Own session: connections (and cookies) aren't shared with other scrapers
+            session=new_session(pool_size=max(self.fetch_config.get("max_concurrency", 1), 10)),
+            max_response_bytes=self.fetch_config.get("max_response_bytes", None),
         )
 
         self.fields = list(df2db_col_map.keys())
         self.df2db_col_map = df2db_col_map
         self.db2df_col_map = {v: k for k, v in df2db_col_map.items()}
 
-        assert self.url_col_name in self.db2df_col_map.keys(), (
+        assert self.url_col_name in self.db2df_col_map, (
             "The id we are use to track scraping progress (assumed to be 'url') must be a column of the database"
         )
 
@@ -101,22 +193,60 @@ class JobListingScraper(ABC):
     def attach_db(self):
         """Attach to database, creating if necessary."""
         self.db = get_database_wrapper(self.db_config, ensure_exists=True)
+        # Speeds up archive lookups and per-URL status updates (no-op until the table exists)
+        self.db.ensure_index_exists(self.db_config.table, self.url_col_name)
+        # Reused by every append, and shared with the wrapper's own queries (one pool per database).
+        # The backend adds its driver's batching options (see DatabaseWrapper.engine_options).
+        self._engine = self.db.engine
+
+    def close(self):
+        """
+        Close pooled HTTP connections (reopened automatically when next needed).
+
+        The database engine is left alone: its pool is shared with every other scraper and
+        wrapper using the database (see DatabaseWrapper.engine), and appends already return
+        their connections to it.
+        """
+        self.fetcher.close()
 
     def append_df_to_db(self, df):
-        """Append DataFrame to database table."""
-        df_with_db_col_names = df.rename(columns=self.df2db_col_map)
+        """
+        Append DataFrame to database table (bulk insert using the backend's loader, e.g. COPY).
 
-        postgres_engine = create_engine(self.db_config.connection_string)
+        The whole batch is written in one transaction: one commit for all chunks, and a failed
+        batch leaves no partial rows behind. Rows per insert call default to the backend's
+        to_sql_chunksize and can be overridden with db_insert_chunksize in the fetch config.
+        """
+        # Relabel a shallow copy: rename() would copy every column buffer (pandas < 3 without CoW)
+        df_with_db_col_names = df.copy(deep=False)
+        df_with_db_col_names.columns = [self.df2db_col_map.get(col, col) for col in df.columns]
+
+        with self._engine.begin() as conn:
+            df_with_db_col_names.to_sql(
+                self.db_config.table,
+                conn,
+                if_exists="append",
+                index=False,
+                method=self.db.to_sql_method,
+                chunksize=self.fetch_config.get("db_insert_chunksize", self.db.to_sql_chunksize),
+            )
 
-        df_with_db_col_names.to_sql(
-            self.db_config.table, postgres_engine, if_exists="append", index=False
-        )
+    def import_db_as_df(self, query=None, params=None, chunksize=None):
+        """
+        Load database table as DataFrame with original column names.
 
-    def import_db_as_df(self, query=None):
-        """Load database table as DataFrame with original column names."""
+        With chunksize, returns an iterator of DataFrames of at most chunksize rows instead, so
+        a large table can be processed without holding all of it in memory at once.
+        """
         query = query if query is not None else f"SELECT * from {self.db_config.table}"
-        df = self.db.export_df(query)
-        return df.rename(columns=self.db2df_col_map)
+        if chunksize is not None:
+            return map(self._relabel_from_db, self.db.export_df(query, params=params, chunksize=chunksize))
+        return self._relabel_from_db(self.db.export_df(query, params=params))
+
+    def _relabel_from_db(self, df):
+        # Freshly loaded frame is ours, so relabel it in place instead of rename() (which copies)
+        df.columns = [self.db2df_col_map.get(col, col) for col in df.columns]
+        return df
 
     def postprocess_df(self, df):
         """
@@ -132,26 +262,39 @@ class JobListingScraper(ABC):
 
         The cache_is_updated flag enables lazy cache export - we only write to disk
         when necessary, not after every status change.
+        The per-status URL index is kept in step, so status lookups never rescan the cache.
+        Entries are stored as given and may be shared between URLs: replace them, don't mutate them.
         """
         assert isinstance(new_data, dict), "New data must be a dict mapping URLs to status info"
+        for url, data in new_data.items():
+            previous_data = self.cache.get(url)  # One lookup for both the membership test and the entry
+            if previous_data is not None:
+                self._urls_by_status[previous_data["status"]].pop(url, None)
+            self._urls_by_status.setdefault(data["status"], {})[url] = None
         self.cache.update(new_data)
         if new_data and not data_directly_from_cache_file:
+            self._unexported_urls.update(new_data)
             self.cache_is_updated = True
 
-    def _cache_from_archive(self):
+    def _cache_from_archive(self, known_successes=(), candidates=None):
         """
         Build cache from database URLs, marking all as SUCCESS_STATUS.
 
         This establishes archive as the source of truth - if it's in the database,
         it was successfully scraped regardless of what the cache file says.
+        URLs in known_successes (already cached as SUCCESS_STATUS) get no new entry.
+        If candidates is given, only those URLs are looked up in the database.
         """
-        archived_urls = self.get_archived_urls()
-
-        cache = { url: {
-                "status": SUCCESS_STATUS,
-                "last_attempt": None,
-                "attempts": 1
-                } for url in archived_urls }
+        archived_urls = self.get_archived_urls(candidates=candidates)
+
+        # All archived URLs share one entry dict rather than allocating one each (cache entries
+        # are only ever replaced, never modified in place)
+        archived_entry = {
+            "status": SUCCESS_STATUS,
+            "last_attempt": None,
+            "attempts": 1
+        }
+        cache = dict.fromkeys((url for url in archived_urls if url not in known_successes), archived_entry)
         return cache
     
     def _load_cache(self, cache_path):
@@ -159,55 +302,155 @@ class JobListingScraper(ABC):
         self.cache_path = cache_path
 
         self.cache = {}  # Stores status info for each URL
+        self._urls_by_status = {}  # status -> URLs with that status (dict used as an ordered set)
+        self._unexported_urls = {}  # URLs changed since the last export (dict used as an ordered set)
+        self._urls_being_archived = set()  # Scraped URLs whose listings are buffered or being written to the database
         self.cache_is_updated = False
 
         if os.path.exists(cache_path):
-            with open(cache_path, "r") as f:
-                try:
-                    self._update_cache(json.load(f), data_directly_from_cache_file=True)
-                except json.JSONDecodeError:
-                    print(f"Could not import cache from {cache_path} due to JSONDecodeError, refreshing cache from archive.")
+            cache_file_stat = os.stat(cache_path)
+            try:
+                # _update_cache() copies the entries into self.cache without mutating them
+                self._update_cache(
+                    _read_cache_file(cache_path, cache_file_stat.st_mtime_ns, cache_file_stat.st_size),
+                    data_directly_from_cache_file=True,
+                )
+            except ValueError as e:  # Damaged file (see _read_cache_file)
+                print(f"Could not import cache from {cache_path} ({e}), refreshing cache from archive.")
         else:
             print(f"{cache_path} does not exist, inferring cache from archive.")
-        
-        cache_inferred_from_archive = self._cache_from_archive()
 
+        self._replay_cache_journal()
+        
         # Merge archive truth with cached failures/pending:
         # - If URL is in archive, mark as SUCCESS (overrides stale failed/pending)
         # - If URL is in cache but not archive, preserve its status (failed/pending)
-        self._update_cache({ url: data for url, data in cache_inferred_from_archive.items() if not (url in self.cache.keys() and self.cache[url]["status"] == SUCCESS_STATUS) })     
+        # The archive is read once, here; afterwards the SUCCESS index tracks it in memory
+        needs_full_archive = True
+        if self.cache:
+            # Only cached URLs not yet marked archived are looked up in the database. The full
+            # archive is still pulled if it holds URLs this cache has never seen.
+            already_successful = self._urls_by_status.get(SUCCESS_STATUS, {})
+            unconfirmed_urls = [url for url in self.cache if url not in already_successful]
+            if unconfirmed_urls:
+                self._update_cache(self._cache_from_archive(candidates=unconfirmed_urls))
+            needs_full_archive = self._archive_has_uncached_urls()
+
+        if needs_full_archive:
+            already_successful = self._urls_by_status.get(SUCCESS_STATUS, {})
+            self._update_cache(self._cache_from_archive(known_successes=already_successful))
+
+    @property
+    def cache_journal_path(self):
+        """Append-only JSON Lines file holding cache updates made since the last full export."""
+        return _cache_journal_path(self.cache_path)
+
+    def _replay_cache_journal(self):
+        """
+        Fold journaled cache updates into the cache (later lines win).
+
+        Damaged lines are skipped (see _read_cache_journal), and the journal is then compacted
+        right away so new entries aren't appended onto a broken line.
+        """
+        self._journal_line_count = 0
+        if not os.path.exists(self.cache_journal_path):
+            return
+
+        journaled_data, self._journal_line_count, journal_is_damaged = _read_cache_journal(self.cache_journal_path)
+        self._update_cache(journaled_data, data_directly_from_cache_file=True)
+
+        if journal_is_damaged:
+            self._export_full_cache()
+
+    def _exportable(self, url, data):
+        """
+        Cache entry as it should be saved to disk.
+
+        Converts TEMP_FAILURE_STATUS to TEMP_STATUS so transient failures are retried next session,
+        and saves successes still being written to the database as TEMP_STATUS too (so a crash
+        before the write lands can't leave them marked as archived).
+        """
+        if data["status"] == TEMP_FAILURE_STATUS:
+            return {**data, "status": TEMP_STATUS}
+        if data["status"] == SUCCESS_STATUS and url in self._urls_being_archived:
+            return {**data, "status": TEMP_STATUS}
+        return data
 
     def _export_cache(self):
         """
-        Write complete cache to JSON cache file with status.
+        Persist cache changes since the last export.
 
-        Converts TEMP_FAILURE_STATUS to TEMP_STATUS on export so transient
-        failures are retried in next session.
+        Changed entries are appended to the cache journal, so an export costs O(changes) rather
+        than rewriting the whole cache. Once the journal holds more lines than the cache has
+        URLs (or no cache file exists yet), it is compacted into a full cache file export.
         """
-        cache_to_export = {}
-        for url, data in self.cache.items():
-            if data["status"] == TEMP_FAILURE_STATUS:
-                cache_to_export[url] = {**data, "status": TEMP_STATUS}
-            else:
-                cache_to_export[url] = data
+        if self._unexported_urls:
+            # Serialized up front and written with a single append call
+            journal_lines = b"".join(
+                json_dumps_bytes({"url": url, **self._exportable(url, self.cache[url])}) + b"\n"
+                for url in self._unexported_urls
+            )
+            with open(self.cache_journal_path, "ab") as f:
+                f.write(journal_lines)
+            self._journal_line_count += len(self._unexported_urls)
+            self._unexported_urls = {}
+
+        if self._journal_line_count > len(self.cache) or not os.path.exists(self.cache_path):
+            self._export_full_cache()
 
-        with open(self.cache_path, "w") as f:
-            json.dump(cache_to_export, f, indent=2)
         self.cache_is_updated = False
-    
+
+    def _export_full_cache(self):
+        """
+        Write complete cache to JSON cache file with status, then clear the cache journal.
+
+        Written compactly (orjson when installed) to a temporary file that is synced to disk and
+        then replaces the cache file, so neither an interrupted export nor a crash right after it
+        can leave a truncated cache behind. (Journal appends in between skip the fsync.)
+        A cache path ending in .zst is written as a zstd frame (URLs share long prefixes, so it
+        shrinks several-fold and reloads from fewer bytes).
+        """
+        cache_to_export = {url: self._exportable(url, data) for url, data in self.cache.items()}
+        content = json_dumps_bytes(cache_to_export)
+        if str(self.cache_path).endswith(ZSTD_SUFFIX):
+            if zstandard is None:
+                raise ImportError(f"Writing {self.cache_path} requires zstandard (pip install -e \".[speedups]\").")
+            content = zstandard.ZstdCompressor().compress(content)
+
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.cache_path)
+
+        # Journal is only cleared after the new cache file is in place (replaying it is harmless)
+        if os.path.exists(self.cache_journal_path):
+            os.remove(self.cache_journal_path)
+        self._journal_line_count = 0
+
     def print_cache_summary(self):
         statuses = [SUCCESS_STATUS, FAILURE_STATUS, TEMP_STATUS]
-        status_counts = {status: 0 for status in statuses}
-        for data in self.cache.values():
-            status_counts[data["status"]] += 1
+        # Read off the status index rather than scanning every cache entry
+        status_counts = {status: self._count_cached_urls_by_status(status) for status in statuses}
         print(" | ".join([f"{status}: {count}" for status, count in status_counts.items()]))
 
-    def get_archived_urls(self):
-        """Get list of URLS already successfully archived to database."""
+    def get_archived_urls(self, candidates=None):
+        """
+        Get list of URLS already successfully archived to database.
+
+        If candidates is given, only those of them that are archived are returned (the database
+        checks membership, so the rest of the archive isn't transferred).
+        """
         try:
-            archived_urls = self.db.get_column_values(
-                column_name=self.url_col_name, table_name=self.db_config.table
-            )
+            if candidates is None:
+                archived_urls = self.db.get_column_values(
+                    column_name=self.url_col_name, table_name=self.db_config.table, distinct=True
+                )
+            else:
+                archived_urls = self.db.get_matching_column_values(
+                    column_name=self.url_col_name, table_name=self.db_config.table, values=candidates
+                )
         except Exception as e:
             print(
                 f"Error while attempting to load listings archive:\n{e}\n\nNo listings can be detected. Starting over from scratch."
@@ -216,21 +459,55 @@ class JobListingScraper(ABC):
 
         return archived_urls
 
-    def _filter_cached_urls_by_status(self, statuses: list[str] | str) -> list[str]:
+    def _archive_has_uncached_urls(self) -> bool:
+        """
+        Check (by count, server-side) whether the archive holds URLs not cached as SUCCESS_STATUS.
+
+        The cache covers the archive only if every archived URL is among the cached successes,
+        i.e. if as many of them are archived as there are archived URLs. Comparing the totals
+        alone isn't enough: rows deleted from the table (or a rebuilt database) leave cached
+        successes that are no longer archived, which can balance out URLs archived elsewhere.
+        """
+        cached_successes = self._urls_by_status.get(SUCCESS_STATUS, {})
+        try:
+            n_archived = self.db.count_column_values(
+                column_name=self.url_col_name, table_name=self.db_config.table, distinct=True
+            )
+            if n_archived > len(cached_successes):
+                return True  # More archived URLs than cached successes: some can't be cached
+            n_covered = self.db.count_matching_column_values(
+                column_name=self.url_col_name, table_name=self.db_config.table, values=list(cached_successes)
+            )
+        except Exception:
+            return True  # Can't tell; the full archive read reports the error
+        return n_covered != n_archived
+
+    def _filter_cached_urls_by_status(self, statuses: list[str] | str, limit: int = None) -> list[str]:
         """
-        Filter cached URLs by status.
+        Filter cached URLs by status (at most `limit` of them, if given).
+
+        Reads the per-status index, so the cost scales with the matching URLs rather than
+        with the whole cache (which is mostly already archived URLs).
         """
         if isinstance(statuses, str):
             statuses = [statuses]
 
-        return [url for url, data in self.cache.items() if data["status"] in statuses]
+        matching_urls = (url for status in statuses for url in self._urls_by_status.get(status, ()))
+        return list(islice(matching_urls, limit))
 
-    def _pick_urls_to_archive(self, new_urls: list, retry_failures: bool = False) -> list:
+    def _count_cached_urls_by_status(self, statuses: list[str] | str) -> int:
+        """Count cached URLs by status, in constant time per status (no list is built)."""
+        if isinstance(statuses, str):
+            statuses = [statuses]
+
+        return sum(len(self._urls_by_status.get(status, ())) for status in statuses)
+
+    def _pick_urls_to_archive(self, new_urls: list, retry_failures: bool = False, limit: int = None) -> list:
         """
         Determine which URLs should be scraped in this batch.
 
         Assigns TEMP_STATUS to newly discovered URLs (eager status assignment).
-        Returns all TEMP_STATUS URLs, plus FAILURE_STATUS if retry_failures=True.
+        Returns all TEMP_STATUS URLs (or the first `limit`), plus FAILURE_STATUS if retry_failures=True.
         Excludes TEMP_FAILURE_STATUS (already tried this session).
         This ensures every URL has a status before scraping attempts.
         """
@@ -239,7 +516,7 @@ class JobListingScraper(ABC):
                 "status": TEMP_STATUS,
                 "last_attempt": None,
                 "attempts": 0
-                } for url in new_urls if url not in self.cache.keys() })
+                } for url in new_urls if url not in self.cache })
 
         # Build list of statuses to fetch
         STATUS_LIST_TO_FETCH = [TEMP_STATUS]
@@ -247,7 +524,7 @@ class JobListingScraper(ABC):
             STATUS_LIST_TO_FETCH.append(FAILURE_STATUS)
         # Note: TEMP_FAILURE_STATUS is intentionally excluded (don't retry this session)
 
-        return self._filter_cached_urls_by_status(STATUS_LIST_TO_FETCH)
+        return self._filter_cached_urls_by_status(STATUS_LIST_TO_FETCH, limit=limit)
 
     @abstractmethod
     def fetch_next_batch(self, batch_size: int, retry_failures: bool, listing_batch_size: int = None) -> tuple[list, pd.DataFrame]:
@@ -263,28 +540,81 @@ class JobListingScraper(ABC):
         """
         pass
 
+    def _finish_archiving(self, pending_archive):
+        """
+        Wait for a background database append to finish (re-raising its error, if any).
+
+        Its URLs are then re-marked for export, so their success status is saved next time.
+        """
+        if pending_archive is None:
+            return
+        append_future, archived_urls = pending_archive
+        append_future.result()
+        self._urls_being_archived -= archived_urls
+        self._unexported_urls.update(dict.fromkeys(archived_urls))
+        self.cache_is_updated = True
+
+    def _flush_archive_buffer(self, archive_writer, archive_buffer, pending_archive):
+        """
+        Hand the buffered listing batches to the background writer as one database append.
+
+        The previous append is finished first, so appends land one at a time, in order.
+        Returns the new pending append: (future, URLs being written), or None if nothing was buffered.
+        """
+        self._finish_archiving(pending_archive)
+        if not archive_buffer:
+            return None
+
+        if len(archive_buffer) == 1:
+            listings_df = archive_buffer[0]
+        else:
+            listings_df = pd.concat(archive_buffer, ignore_index=True)
+        archive_buffer.clear()
+
+        url_df_col_name = self.db2df_col_map[self.url_col_name]
+        return archive_writer.submit(self.append_df_to_db, listings_df), set(listings_df[url_df_col_name])
+
     def propagate(self, batch_size: int = 10, retry_failures: bool = False, listing_batch_size: int = None) -> pd.DataFrame:
         """
         Common orchestration logic for all scrapers.
         Fetches batches until all listings are scraped.
 
+        Scraped batches are buffered until they hold archive_flush_rows listings (or scraping
+        ends), then appended to the database together on a background thread while the next
+        batches are being fetched, so database writes are few and overlap network scraping.
+        Buffered listings stay pending in the exported cache until their append lands.
+        However scraping ends (Ctrl+C, circuit breaker, any other error), buffered listings are
+        still archived before the error is re-raised.
+
         Args:
             batch_size: Number of directory pages to scrape per batch
             retry_failures: If True, retry previously failed URLs; if False, skip them
             listing_batch_size: Max number of detail listings to scrape per iteration (default: all pending)
         """
+        archive_writer = ThreadPoolExecutor(max_workers=1)
+        pending_archive = None  # (future, URLs) for the database append in progress
+        archive_buffer = []  # Scraped listing batches not yet handed to the database
+        url_df_col_name = self.db2df_col_map[self.url_col_name]
+
         try:
             while not self.listing_scraping_completed:
-                # Fetch next batch
+                # Fetch next batch (overlaps with the previous database append)
                 scraped_urls, listing_batch_df = self.fetch_next_batch(
                     batch_size,
                     retry_failures=retry_failures,
                     listing_batch_size=listing_batch_size
                 )
 
-                # Archive new listings
                 if len(listing_batch_df) > 0:
-                    self.append_df_to_db(listing_batch_df)
+                    archive_buffer.append(listing_batch_df)
+                    self._urls_being_archived.update(listing_batch_df[url_df_col_name])
+
+                # Archive buffered listings in the background once there are enough of them
+                if sum(len(df) for df in archive_buffer) >= self.archive_flush_rows:
+                    pending_archive = self._flush_archive_buffer(archive_writer, archive_buffer, pending_archive)
+                elif pending_archive is not None and pending_archive[0].done():
+                    self._finish_archiving(pending_archive)  # Lets its successes be exported now
+                    pending_archive = None
 
                 # Lazy export: only write to disk when cache has changed
                 if self.cache_is_updated:
@@ -293,24 +623,40 @@ class JobListingScraper(ABC):
                 # Check if we're done: completion when no queue remain
                 # Must check same statuses as _pick_urls_to_archive() to avoid early exit
                 if not scraped_urls:
-                    url_queue = self._filter_cached_urls_by_status(TEMP_STATUS)
-                    # Clever trick: retry_failures is bool (0 or 1), so this adds failed URLs only when retry_failures=True
-                    url_queue += retry_failures * self._filter_cached_urls_by_status(FAILURE_STATUS)
-
-                    if not url_queue:
+                    queued_statuses = [TEMP_STATUS, FAILURE_STATUS] if retry_failures else [TEMP_STATUS]
+                    if not self._count_cached_urls_by_status(queued_statuses):
                         self.listing_scraping_completed = True
                         break
 
                 # Be polite to the server
                 time.sleep(self.fetch_config.batch_delay)
 
-        except KeyboardInterrupt:
-            print("\n\nInterrupted by user - saving progress...")
+            # Last batches must land in the database before their URLs are saved as archived
+            pending_archive = self._flush_archive_buffer(archive_writer, archive_buffer, pending_archive)
+            self._finish_archiving(pending_archive)
+            if self.cache_is_updated:
+                self._export_cache()
+
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                print("\n\nInterrupted by user - saving progress...")
+            # A failed append must not stop the rest from being saved, nor mask the original error
+            try:
+                self._finish_archiving(pending_archive)
+            except Exception as archive_error:
+                print(f"✗ Archiving failed: {archive_error}")
+            try:
+                self._finish_archiving(self._flush_archive_buffer(archive_writer, archive_buffer, None))
+            except Exception as archive_error:
+                print(f"✗ Archiving failed: {archive_error}")
             if self.cache_is_updated:
                 self._export_cache()
                 print(f"✓ Cache exported to {self.cache_path}")
             raise  # Re-raise so orchestration layer can handle cleanup
 
+        finally:
+            archive_writer.shutdown(wait=True)
+
 
 class HTMLScraper(JobListingScraper):
     """
@@ -330,6 +676,7 @@ class HTMLScraper(JobListingScraper):
         fetch_config=None,
     ):
         self.current_directory_page = current_directory_page
+        self._parse_pool = None  # Worker processes for parse_listing_webpage (see parse_workers)
 
         super().__init__(
             df2db_col_map=df2db_col_map,
@@ -350,33 +697,135 @@ class HTMLScraper(JobListingScraper):
 
     @abstractmethod
     def parse_listing_webpage(self, url, html_response) -> dict:
-        """Extract job details from individual job page."""
+        """
+        Extract job details from individual job page.
+
+        html_response is the requests.Response; use parse_html() to turn it into a soup, or
+        parse_html_tree() for a (much faster) lxml tree queried with XPath/CSS selectors.
+        Implemented as a @staticmethod, it can run in worker processes (fetch_config.parse_workers).
+        """
         pass
 
+    def close(self):
+        super().close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+
+    def _get_parse_pool(self, parse_workers: int) -> ProcessPoolExecutor:
+        """
+        Process pool that parses listing pages, created on first use and kept until close().
+
+        Only a staticmethod parse_listing_webpage can be sent to another process (a bound method
+        would have to pickle the whole scraper, with its sessions and database engine).
+
+        Workers are started by a fork server (spawned where that isn't available), never forked
+        from this process: it is running fetch and archive-writer threads by then, and a fork
+        would copy any lock they hold into the worker, still held.
+        """
+        assert isinstance(inspect.getattr_static(type(self), "parse_listing_webpage"), staticmethod), (
+            "parse_workers requires parse_listing_webpage to be a @staticmethod"
+        )
+        if self._parse_pool is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=parse_workers, mp_context=multiprocessing.get_context(start_method)
+            )
+        return self._parse_pool
+
+    @staticmethod
+    def parse_html(html_response) -> BeautifulSoup:
+        """
+        Parse a fetched page with BeautifulSoup's lxml (C) parser.
+
+        Feeds the raw bytes rather than response.text: lxml reads the charset from the document
+        itself, skipping the charset detection requests runs when the header doesn't name one.
+        """
+        return BeautifulSoup(html_response.content, "lxml")
+
+    @staticmethod
+    def parse_html_tree(html_response) -> lxml.html.HtmlElement:
+        """
+        Parse a fetched page straight into an lxml element tree.
+
+        Skips building BeautifulSoup's Python-level tree on top of lxml's, which is most of
+        parse_html()'s cost; query the result with .xpath(), or .cssselect() if cssselect is
+        installed. Prefer this for new scrapers.
+        """
+        return lxml.html.fromstring(html_response.content)
+
     def scrape_next_listing_batch(self, urls) -> pd.DataFrame:
-        """Fetch and parse multiple job listing pages."""
+        """
+        Fetch and parse multiple job listing pages.
+
+        Up to fetch_config.max_concurrency pages (default: 1) are downloaded at once by a thread
+        pool, so network round trips overlap. Requests to the same host still start at least
+        request_delay seconds apart (after an initial burst of up to fetch_config.request_burst,
+        default: 1), and wait out any Retry-After / X-RateLimit-* pause the
+        server asks for. Parsing and cache updates happen in order on this thread,
+        which the downloads run at most two rounds ahead of.
+
+        With fetch_config.parse_workers set, pages are instead parsed by that many worker
+        processes as soon as they arrive, so CPU-bound parsing (BeautifulSoup especially)
+        overlaps with downloads and uses more than one core.
+        """
         temp_cache = {}
         scraped_info_list = []
 
+        host_throttle = HostThrottle(
+            min_interval=self.fetch_config.request_delay,
+            burst=self.fetch_config.get("request_burst", 1),
+        )  # Be polite
+
+        parse_workers = self.fetch_config.get("parse_workers", None)
+        parse_pool = self._get_parse_pool(parse_workers) if parse_workers else None
+
+        def fetch(url):
+            # Each attempt waits for the host's slot; rate-limit responses push the host back
+            # A listing that redirects elsewhere is gone; don't download the page it points to
+            response, classification, error_msg = self.fetcher.fetch(
+                url, allow_redirects=False, throttle=host_throttle
+            )
+            parsed_listing = None
+            if parse_pool is not None and classification == LINK_GOOD:
+                parsed_listing = parse_pool.submit(
+                    type(self).parse_listing_webpage, url=url, html_response=response
+                )
+            return response, classification, error_msg, parsed_listing
+
+        max_concurrency = self.fetch_config.get("max_concurrency", 1)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
         try:
-            for listing_url in tqdm(urls):
-                response, classification, error_msg = self.fetcher.fetch(listing_url)
+            # Bar redraws at most twice a second, and not at all when output isn't a terminal
+            # (e.g. scheduled runs logging to a file)
+            for listing_url, (response, classification, error_msg, parsed_listing) in tqdm(
+                zip(urls, _map_ahead(executor, fetch, urls, window=2 * max_concurrency)),
+                total=len(urls),
+                mininterval=0.5,
+                disable=None,
+            ):
+                # One clock read per listing, shared by the listing row and its cache entry
+                attempt_time = datetime.now()
+                last_attempt = attempt_time.isoformat()
 
                 if classification == LINK_GOOD:
-                    scraped_info = self.parse_listing_webpage(
-                        url=listing_url, html_response=response
-                    )
+                    if parsed_listing is not None:
+                        scraped_info = parsed_listing.result()
+                    else:
+                        scraped_info = self.parse_listing_webpage(
+                            url=listing_url, html_response=response
+                        )
 
                     # Set initial status and timestamp (if columns exist in df2db_col_map)
                     scraped_info["Status"] = "active"
-                    scraped_info["Last Checked"] = datetime.now()
+                    scraped_info["Last Checked"] = attempt_time
 
                     scraped_info_list.append(scraped_info)
 
                     # Mark as successful in cache
                     temp_cache[listing_url] = {
                         "status": SUCCESS_STATUS,
-                        "last_attempt": datetime.now().isoformat(),
+                        "last_attempt": last_attempt,
                         "attempts": self.cache[listing_url]["attempts"] + 1
                     }
 
@@ -386,7 +835,7 @@ class HTMLScraper(JobListingScraper):
                     )
                     temp_cache[listing_url] = {
                         "status": FAILURE_STATUS,
-                        "last_attempt": datetime.now().isoformat(),
+                        "last_attempt": last_attempt,
                         "attempts": self.cache[listing_url]["attempts"] + 1,
                         "error": error_msg or "Permanent failure"
                     }
@@ -395,50 +844,70 @@ class HTMLScraper(JobListingScraper):
                     print(f"Transient failure for {listing_url}: {error_msg or 'Unknown error'}")
                     temp_cache[listing_url] = {
                         "status": TEMP_FAILURE_STATUS,
-                        "last_attempt": datetime.now().isoformat(),
+                        "last_attempt": last_attempt,
                         "attempts": self.cache[listing_url]["attempts"] + 1,
                         "error": error_msg or "Transient failure"
                     }
 
-                time.sleep(self.fetch_config.request_delay)
-
         except KeyboardInterrupt:
             # Save partial progress before re-raising
             if temp_cache:
                 self._update_cache(temp_cache)
             raise  # Re-raise to bubble up
 
+        finally:
+            # Don't wait for (or start) queued fetches if the loop was interrupted
+            executor.shutdown(wait=False, cancel_futures=True)
+
         # Batch update cache after all scraping attempts (reduces I/O)
         self._update_cache(temp_cache)
 
         if len(scraped_info_list):
-            return self.postprocess_df(pd.DataFrame(scraped_info_list))
+            # Listing text (descriptions especially) is held as Arrow strings until archived.
+            # Rows stay dicts: from_records converts them in C, which measured no slower than
+            # collecting per-column lists in Python (parse_listing_webpage may add extra keys)
+            return use_arrow_strings(self.postprocess_df(pd.DataFrame.from_records(scraped_info_list)))
         else:
             return pd.DataFrame()
 
     def scrape_next_url_batch(self, pages_per_batch: int) -> list:
-        """Scrape URLs from multiple directory pages."""
+        """
+        Scrape URLs from multiple directory pages.
+
+        Like listing pages, up to fetch_config.max_concurrency directory pages are fetched at
+        once, starting at least request_delay seconds apart. Pages are consumed in order and the
+        batch stops at the first empty page (queued pages past it are cancelled).
+        """
         assert pages_per_batch > 0, (
             "Wot in tarnation! Your pages_per_batch is not a positive number!"
         )
 
         page_start = self.current_directory_page
         page_end = page_start + pages_per_batch
+        pages = range(page_start, page_end)
+
+        directory_throttle = HostThrottle(min_interval=self.fetch_config.request_delay)  # Be polite
+
+        def scrape_page(page):
+            directory_throttle.wait_for_host("directory")  # All directory pages come from one site
+            return self.scrape_urls_by_directory_page(page)
 
         scraped_urls = []
         print("Jobs found by directory page: ", end="")
-        for page in range(page_start, page_end):
-            page_i_urls = self.scrape_urls_by_directory_page(page)
-            n_urls_added = len(page_i_urls)
-            if page > page_start:
-                print(" "*30, end="")
-            print(f"{n_urls_added:-3} on page {page:-3}\n", end="")
-            # Empty page indicates end of directory listing
-            if not n_urls_added:
-                self.url_scraping_completed = True
-                break
-            scraped_urls += page_i_urls
-            time.sleep(self.fetch_config.request_delay)
+        executor = ThreadPoolExecutor(max_workers=self.fetch_config.get("max_concurrency", 1))
+        try:
+            for page, page_i_urls in zip(pages, executor.map(scrape_page, pages)):
+                n_urls_added = len(page_i_urls)
+                if page > page_start:
+                    print(" "*30, end="")
+                print(f"{n_urls_added:-3} on page {page:-3}\n", end="")
+                # Empty page indicates end of directory listing
+                if not n_urls_added:
+                    self.url_scraping_completed = True
+                    break
+                scraped_urls += page_i_urls
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         self.current_directory_page = page + 1
         return scraped_urls
@@ -454,35 +923,41 @@ class HTMLScraper(JobListingScraper):
 
 
         # Phase 1: Get new URLs (skip if we have a backlog larger than listing_batch_size)
+        # Only the backlog's size is needed, which the status index gives without listing it
         new_urls = []
-        url_backlog = self._filter_cached_urls_by_status(TEMP_STATUS)
-        url_backlog += retry_failures * self._filter_cached_urls_by_status(FAILURE_STATUS)
+        queued_statuses = [TEMP_STATUS, FAILURE_STATUS] if retry_failures else [TEMP_STATUS]
+        url_backlog_size = self._count_cached_urls_by_status(queued_statuses)
 
         if self.url_scraping_completed:
             pass
         else:
             # Check if there is a listings backlog (not yet attempted this session)
-            if listing_batch_size is None or len(url_backlog) < listing_batch_size:
+            if listing_batch_size is None or url_backlog_size < listing_batch_size:
                 new_urls = self.scrape_next_url_batch(pages_per_batch=batch_size)
             else:
-                print(f"Skipping directory scan - backlog of {len(url_backlog)} listings to process first")
+                print(f"Skipping directory scan - backlog of {url_backlog_size} listings to process first")
 
         # Phase 2: Get unarchived URLs and fetch their details
+        # Queue size = backlog + newly discovered URLs, counted without listing the queue
+        n_queued = url_backlog_size + len({url for url in new_urls if url not in self.cache})
+
+        # Limit to listing_batch_size if specified (only that many URLs are listed)
+        limit = None
+        if listing_batch_size is not None and n_queued >= 2* listing_batch_size:
+            limit = listing_batch_size
+            print(f"Limiting batch to {listing_batch_size} listings (out of a backlog of {url_backlog_size})")
+
         urls_of_listings_to_fetch = self._pick_urls_to_archive(
             new_urls,
-            retry_failures=retry_failures
+            retry_failures=retry_failures,
+            limit=limit,
         )
 
-        # Limit to listing_batch_size if specified
-        if listing_batch_size is not None and len(urls_of_listings_to_fetch) >= 2* listing_batch_size:
-            urls_of_listings_to_fetch = urls_of_listings_to_fetch[:listing_batch_size]
-            print(f"Limiting batch to {listing_batch_size} listings (out of a backlog of {len(url_backlog)})")
-
         if not self.url_scraping_completed and new_urls:
             batch_summary_printout = " "*30 + "-"*20 + "\n" + " "*30
             batch_summary_printout += f"{len(new_urls):-3} total | {len(urls_of_listings_to_fetch):-3} to fetch"
             print(batch_summary_printout)
-        elif self.url_scraping_completed and not url_backlog:
+        elif self.url_scraping_completed and not url_backlog_size:
             print(f"✓ Directory scan complete.")
 
         # Export cache now if new URLs were assigned pending status
@@ -514,6 +989,7 @@ class APIScraper(JobListingScraper):
     ):
         self.base_url = base_url
         self.batch_current = 0
+        self.api_exhausted = False  # Set once the API returns an empty page (no listings left)
 
         super().__init__(
             df2db_col_map=df2db_col_map,
@@ -536,7 +1012,14 @@ class APIScraper(JobListingScraper):
         Implementation of abstract method for API scraping.
         Single-phase: API returns full listing data in one call.
         """
+        # The API has run out of listings, and it can't serve cached URLs individually,
+        # so another call would just re-request the same empty page
+        if self.api_exhausted:
+            self.listing_scraping_completed = True
+            return [], pd.DataFrame()
+
         listing_index = self.batch_current * batch_size
+        last_attempt = datetime.now().isoformat()  # Whole batch comes from a single API call
 
         try:
             fetched_data = self.fetch_next_listing_batch(
@@ -556,8 +1039,8 @@ class APIScraper(JobListingScraper):
                 temp_cache = {
                     url: {
                         "status": FAILURE_STATUS,
-                        "last_attempt": datetime.now().isoformat(),
-                        "attempts": self.cache.get(url, {}).get("attempts", 0) + 1,
+                        "last_attempt": last_attempt,
+                        "attempts": self.cache[url]["attempts"] + 1,
                         "error": str(e)
                     }
                     for url in fetched_urls if url in self.cache
@@ -568,6 +1051,7 @@ class APIScraper(JobListingScraper):
             return [], pd.DataFrame()
         
         if not len(fetched_urls):
+            self.api_exhausted = True
             return [], pd.DataFrame()
 
         # Filter to only unarchived listings
@@ -575,14 +1059,20 @@ class APIScraper(JobListingScraper):
             fetched_urls,
             retry_failures=retry_failures
         )
-        to_archive_mask = fetched_listings_df[self.url_col_name].isin(unarchived_urls)
-        listings_to_archive_df = fetched_listings_df[to_archive_mask]
+        # Checked row by row against a set: Series.isin() would first convert the whole list of
+        # unarchived URLs (every pending URL in the cache, not just this batch) to an array
+        unarchived_url_set = set(unarchived_urls)
+        to_archive_mask = [url in unarchived_url_set for url in fetched_listings_df[self.url_col_name]]
+        if all(to_archive_mask):
+            listings_to_archive_df = fetched_listings_df  # Usual case: nothing to drop, skip the copy
+        else:
+            listings_to_archive_df = fetched_listings_df[to_archive_mask]
 
         # Mark successfully fetched URLs as success
         temp_cache = {
             url: {
                 "status": SUCCESS_STATUS,
-                "last_attempt": datetime.now().isoformat(),
+                "last_attempt": last_attempt,
                 "attempts": self.cache[url]["attempts"] + 1
             }
             for url in unarchived_urls
@@ -13,6 +13,7 @@ Similar pattern to storage context's process_status_events().
 import os
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,8 +22,12 @@ from dotenv import load_dotenv
 from loguru import logger
 
 # Import scraper registry
+from scout.contexts.scraping import scrapers
 from scout.contexts.scraping.scrapers import __all__ as AVAILABLE_SCRAPERS
 
+# Scraper classes by name, resolved once (a name in __all__ without a class fails at import)
+_SCRAPER_REGISTRY: dict[str, type] = {name: getattr(scrapers, name) for name in AVAILABLE_SCRAPERS}
+
 load_dotenv()
 LOGS_PATH = Path(os.getenv("LOGS_PATH", "outs/logs"))
 
@@ -65,7 +70,7 @@ def _get_available_scrapers() -> list[str]:
 
 def _import_scraper_class(scraper_name: str) -> type:
     """
-    Dynamically import a scraper class by name.
+    Look up a scraper class by name in the registry built from scrapers.__all__.
 
     Args:
         scraper_name: Name of scraper class (e.g., "MomCorpScraper")
@@ -76,12 +81,9 @@ def _import_scraper_class(scraper_name: str) -> type:
     Raises:
         ImportError: If scraper cannot be imported
     """
-    from scout.contexts.scraping import scrapers
-
     try:
-        scraper_class = getattr(scrapers, scraper_name)
-        return scraper_class
-    except AttributeError:
+        return _SCRAPER_REGISTRY[scraper_name]
+    except KeyError:
         raise ImportError(f"Scraper '{scraper_name}' not found in scrapers module")
 
 
@@ -147,16 +149,14 @@ def run_scraper(
 
         scraper = scraper_class(**init_kwargs)
 
-        # Get initial row count
-        initial_df = scraper.import_db_as_df()
-        initial_rows = len(initial_df)
+        # Get initial row count (counted by the database; the table itself isn't transferred)
+        initial_rows = scraper.db.count_rows(scraper.db_config.table)
 
         # Run scraper (may return None or DataFrame)
         scraper.propagate(**propagate_kwargs)
 
         # Get final row count from database
-        final_df = scraper.import_db_as_df()
-        final_rows = len(final_df)
+        final_rows = scraper.db.count_rows(scraper.db_config.table)
         rows_added = final_rows - initial_rows
         elapsed = time.time() - start_time
 
@@ -185,8 +185,7 @@ def run_scraper(
         if scraper:  # Scraper was successfully instantiated
             try:
                 database_name = scraper.db_config.name
-                current_df = scraper.import_db_as_df()
-                rows_added_partial = len(current_df) - initial_rows
+                rows_added_partial = scraper.db.count_rows(scraper.db_config.table) - initial_rows
             except Exception:
                 # If we can't get current state, leave as 0
                 pass
@@ -213,6 +212,10 @@ def run_scraper(
         if verbose:
             logger.debug(f"[{scraper_name}] Traceback:\n{error_traceback}")
 
+    finally:
+        if scraper:
+            scraper.close()  # Don't hold pooled HTTP connections open while the next scraper runs
+
     return result
 
 
@@ -221,6 +224,7 @@ def run_scrapers(
     verbose: bool = True,
     log_dir: Path = LOGS_PATH,
     scraper_kwargs: dict[str, Any] | None = None,
+    max_parallel: int = 1,
 ) -> dict[str, dict[str, Any]]:
     """
     Orchestrator: run one or more scrapers with detailed logging.
@@ -236,6 +240,10 @@ def run_scrapers(
                        Supports both __init__ params (e.g., "current_directory_page")
                        and propagate() params (e.g., "batch_size", "retry_failures",
                        "listing_batch_size"). Defaults: batch_size=50, retry_failures=False
+        max_parallel: How many scrapers run at once, each on its own thread (default: 1,
+                      i.e. one after another). Scrapers target different sites and mostly wait
+                      on the network, so running several overlaps their waits; their progress
+                      output interleaves, and Ctrl+C only reaches scrapers run serially.
 
     Returns:
         Dict mapping scraper_name → result dict with keys:
@@ -295,12 +303,34 @@ def run_scrapers(
     successes = 0
     failures = 0
 
-    for scraper_name in scraper_names:
-        result = run_scraper(
-            scraper_name=scraper_name,
-            verbose=verbose,
-            scraper_kwargs=scraper_kwargs,
+    if max_parallel > 1:
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(scraper_names))) as executor:
+            futures = {
+                executor.submit(
+                    run_scraper,
+                    scraper_name=scraper_name,
+                    verbose=verbose,
+                    scraper_kwargs=scraper_kwargs,
+                ): scraper_name
+                for scraper_name in scraper_names
+            }
+            # run_scraper catches scraper errors itself, so result() doesn't raise
+            completed = {futures[future]: future.result() for future in as_completed(futures)}
+        scraper_results = ((scraper_name, completed[scraper_name]) for scraper_name in scraper_names)
+    else:
+        scraper_results = (
+            (
+                scraper_name,
+                run_scraper(
+                    scraper_name=scraper_name,
+                    verbose=verbose,
+                    scraper_kwargs=scraper_kwargs,
+                ),
+            )
+            for scraper_name in scraper_names
         )
+
+    for scraper_name, result in scraper_results:
         results[scraper_name] = result
 
         if result["status"] == "success":
@@ -1,19 +1,45 @@
 """HTTP helpers shared by scraping contexts."""
 
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import urljoin, urlsplit
 
 import requests
+import threading
 import time
+from requests.adapters import HTTPAdapter
 
-PermanentCodeSet = (401, 403, 404, 410)
-TransientCodeSet = (408, 425, 429, 500, 502, 503, 504) 
+PermanentCodeSet = frozenset({401, 403, 404, 410})
+TransientCodeSet = frozenset({408, 425, 429, 500, 502, 503, 504})
 
 PermanentErrorTypes = (requests.exceptions.InvalidURL, requests.exceptions.TooManyRedirects)
 
+MAX_RETRY_AFTER = 60.0  # Cap (seconds) on how long a server's Retry-After can stall a retry
+
 LINK_GOOD = "success"
 LINK_BAD = "failure"
 LINK_UNKNOWN = "transient failure"
 
+def new_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a pooled session, so repeat requests to a host reuse its keep-alive connection
+    instead of redoing DNS + TCP + TLS every time.
+
+    pool_size bounds the connections kept per host (use at least the number of threads
+    sharing the session). Retries stay in html_request_with_retry (the adapter never retries).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, adapter)
+    return session
+
+
+# Shared by callers that don't bring their own session
+_session = new_session()
+
 def classify_http_outcome(
     url: str,
     exception: Optional[requests.RequestException] = None,
@@ -24,18 +50,20 @@ def classify_http_outcome(
 
     if response is not None: # We received a response object.
         status = response.status_code
-        response_success_condition = (200 <= status < 300)
-        response_failure_condition = (
-            response.url.rstrip("/") != url.rstrip("/") or
-            status in PermanentCodeSet
-        )
-
-        if response_success_condition:
+        # Checked cheapest first: most responses are successes, which need no URL comparison
+        if 200 <= status < 300:
             return LINK_GOOD
-        elif response_failure_condition:
+        if status in PermanentCodeSet:
             return LINK_BAD
+
+        # An unfollowed redirect (allow_redirects=False) is judged by where it points
+        if response.is_redirect:
+            final_url = urljoin(response.url, response.headers["Location"])
         else:
-            return LINK_UNKNOWN
+            final_url = response.url
+        if final_url.rstrip("/") != url.rstrip("/"):
+            return LINK_BAD
+        return LINK_UNKNOWN
 
     elif exception is not None: # We didn't receive a response object, but we did receive an exception.
         if isinstance(exception, PermanentErrorTypes):
@@ -46,16 +74,63 @@ def classify_http_outcome(
         # We received nothing. We know nothing about the link.
         return LINK_UNKNOWN
 
-def html_request_with_retry(url, method="GET", max_attempts=3, delay=1.0, **kwargs):
+def _retry_after_seconds(response: Optional[requests.Response]) -> Optional[float]:
+    """Read a Retry-After header (delay in seconds, or an HTTP date) as seconds to wait."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if not retry_after:
+        return None
+
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def _rate_limit_reset_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Seconds until an exhausted X-RateLimit-* quota resets, or None if requests remain.
+
+    X-RateLimit-Reset is read as a Unix timestamp when it looks like one, else as a delay.
+    """
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+
+    try:
+        reset = float(response.headers.get("X-RateLimit-Reset", ""))
+    except ValueError:
+        return None
+
+    if reset > 1e9:  # Epoch seconds
+        reset -= time.time()
+    return min(max(reset, 0.0), MAX_RETRY_AFTER)
+
+
+def html_request_with_retry(url, method="GET", max_attempts=3, delay=1.0, session=None, throttle=None, **kwargs):
     """
     Make an HTTP request with automatic retry on failure.
 
+    Retries wait an exponentially growing, randomly jittered delay (so concurrent workers
+    don't retry in lockstep), or as long as the server's Retry-After header asks (capped).
+    Client errors that retrying can't fix (4xx other than 408/425/429) are raised straight away.
+
+    With a HostThrottle, every attempt (retries included) waits for its slot, and a server's
+    Retry-After or exhausted X-RateLimit-* quota defers the whole host, so concurrent
+    workers sharing the throttle hold off too instead of each discovering the limit.
+
     Args:
         url (str): The URL to request
-        method (str): HTTP method - either 'GET' or 'POST' (default: 'GET')
+        method (str): HTTP method, e.g. 'GET', 'POST' or 'HEAD' (default: 'GET')
         max_attempts (int): How many times to try the request (default: 3)
         delay (float): Initial delay in seconds between retries (default: 1.0)
-        **kwargs: Any additional arguments to pass to requests.get() or requests.post()
+        session (requests.Session): Session to send the request with (default: a shared
+            module-level session, see new_session())
+        throttle (HostThrottle): Per-host pacing shared with other callers (default: none)
+        **kwargs: Any additional arguments to pass to requests.Session.request()
 
     Returns:
         requests.Response: The response object from successful request
@@ -64,42 +139,147 @@ def html_request_with_retry(url, method="GET", max_attempts=3, delay=1.0, **kwar
         requests.RequestException: If all retry attempts fail
     """
     most_recent_exception = None
+    session = session if session is not None else _session
 
     for attempt in range(max_attempts):
+        if throttle is not None:
+            throttle.wait(url)
+
         try:
-            if method == "GET":
-                response = requests.get(url, **kwargs)
-            elif method == "POST":
-                response = requests.post(url, **kwargs)
+            response = session.request(method, url, **kwargs)
+            if throttle is not None:
+                quota_reset = _rate_limit_reset_seconds(response)
+                if quota_reset is not None:
+                    throttle.defer(url, quota_reset)
             response.raise_for_status()
             return response
 
         except requests.RequestException as e:
             most_recent_exception = e
 
+            status = getattr(e.response, "status_code", None)
+            if status is not None and 400 <= status < 500 and status not in TransientCodeSet:
+                break  # e.g. 404: the same client error won't go away on retry
+
             if attempt < max_attempts - 1:
-                wait_time = delay * (2**attempt)
-                print(f"Request failed, retrying in {wait_time}s...")
+                wait_time = _retry_after_seconds(e.response)
+                if wait_time is not None and throttle is not None:
+                    throttle.defer(url, wait_time)  # The next attempt waits for the host's slot
+                    print(f"Request failed, retrying in {wait_time:.1f}s (host deferred)...")
+                    continue
+                if wait_time is None:
+                    wait_time = delay * (2**attempt) * random.uniform(0.5, 1.0)
+                print(f"Request failed, retrying in {wait_time:.1f}s...")
                 time.sleep(wait_time)
 
     raise most_recent_exception
 
 
+class HostThrottle:
+    """
+    Space out requests to the same host by at least min_interval seconds (thread-safe).
+
+    Each caller reserves the next free slot for its host, so concurrent workers stay polite
+    to any one server without stalling requests to unrelated hosts.
+
+    With burst > 1 this is a per-host token bucket: a host that has been idle may receive up to
+    `burst` requests at once, while the sustained rate stays one per min_interval.
+    """
+
+    def __init__(self, min_interval: float, burst: int = 1):
+        self.min_interval = min_interval
+        self.burst = burst
+        self._next_slot = {}  # host -> when its next request is due at the steady rate
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        self.wait_for_host(urlsplit(url).netloc)
+
+    def wait_for_host(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            due = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = due + self.min_interval
+            # Unused burst capacity lets a request start up to burst - 1 intervals early
+            slot = max(now, due - (self.burst - 1) * self.min_interval)
+        time.sleep(slot - now)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold off every request to url's host for at least `seconds` (e.g. after a 429)."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            # Also drains the burst capacity, so no request starts before resume_at
+            resume_at += (self.burst - 1) * self.min_interval
+            self._next_slot[host] = max(self._next_slot.get(host, resume_at), resume_at)
+
+
 class NetworkCircuitBreakerException(Exception):
     pass
 
 
+def _read_body_capped(response: requests.Response, max_bytes: int) -> bool:
+    """
+    Download a streamed response's body unless it is larger than max_bytes.
+
+    An oversized body is detected from Content-Length when the server sends one, otherwise
+    while downloading; either way the connection is dropped without reading the rest.
+    Returns whether the body was read (it is then available as response.content as usual).
+    """
+    declared_length = response.headers.get("Content-Length", "")
+    if declared_length.isdigit() and int(declared_length) > max_bytes:
+        response.close()
+        return False
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > max_bytes:
+            response.close()
+            return False
+
+    response._content = bytes(body)  # Where requests keeps a downloaded body for .content/.text
+    return True
+
+
 class URLFetcher:
-    def __init__(self, max_consecutive_failures=5, request_delay=1.0, max_retries=3):
+    def __init__(self, max_consecutive_failures=5, request_delay=1.0, max_retries=3, session=None, max_response_bytes=None, throttle=None):
         self.max_consecutive_failures = max_consecutive_failures
         self.request_delay = request_delay
         self.max_retries = max_retries
+        self.session = session  # None: use html_request_with_retry's shared session
+        self.throttle = throttle  # HostThrottle pacing every fetch that doesn't pass its own (None: no pacing)
+        self.max_response_bytes = max_response_bytes  # None: no limit on page size
         self.consecutive_failures = 0
+        self._lock = threading.Lock()  # fetch() may be called from several worker threads
+
+    def close(self):
+        """
+        Close the fetcher's own session, dropping its pooled keep-alive connections.
+
+        The session reconnects if the fetcher is used again. A fetcher without its own
+        session leaves the shared module-level one open for its other users.
+        """
+        if self.session is not None:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def fetch(self, url, method="GET", **kwargs):
         """
         Fetch URL with retry, classification, and circuit breaking.
 
+        HEAD requests fall back to GET if the server answers 405 Method Not Allowed.
+        With allow_redirects=False, a redirect elsewhere is a permanent failure (no body is
+        downloaded), while a redirect to the same URL (e.g. adding a trailing slash) is followed.
+        If max_response_bytes is set, bodies are streamed and a larger page is a permanent
+        failure (it is abandoned as soon as it exceeds the limit).
+        Requests wait for the fetcher's throttle, unless a throttle is passed to this call.
+
         Returns:
             tuple: (response or None, classification string, error_msg or None)
 
@@ -107,6 +287,10 @@ class URLFetcher:
             NetworkCircuitBreakerException: If consecutive transient failures exceed threshold
         """
         error_msg = None
+        kwargs.setdefault("throttle", self.throttle)
+        capped = self.max_response_bytes is not None and method != "HEAD"
+        if capped:
+            kwargs.setdefault("stream", True)
 
         try:
             response = html_request_with_retry(
@@ -114,22 +298,35 @@ class URLFetcher:
                 method=method,
                 max_attempts=self.max_retries,
                 delay=self.request_delay,
+                session=self.session,
                 **kwargs
             )
             classification = classify_http_outcome(url, response=response)
+            if response.is_redirect and classification != LINK_BAD:
+                response.close()
+                return self.fetch(url, method=method, **{**kwargs, "allow_redirects": True})
+
+            if capped and kwargs["stream"] and not _read_body_capped(response, self.max_response_bytes):
+                classification = LINK_BAD
+                error_msg = f"Response body larger than {self.max_response_bytes} bytes"
+                response = None
         except requests.RequestException as e:
+            if method == "HEAD" and getattr(e.response, "status_code", None) == 405:
+                return self.fetch(url, method="GET", **kwargs)
+
             classification = classify_http_outcome(url, exception=e)
             response = None
             error_msg = str(e)
 
-        if classification == LINK_UNKNOWN:
-            self.consecutive_failures += 1
+        with self._lock:
+            if classification == LINK_UNKNOWN:
+                self.consecutive_failures += 1
 
-            if self.consecutive_failures >= self.max_consecutive_failures:
-                raise NetworkCircuitBreakerException(
-                    f"Circuit breaker: {self.consecutive_failures} consecutive transient failures"
-                )
-        else:
-            self.consecutive_failures = 0
+                if self.consecutive_failures >= self.max_consecutive_failures:
+                    raise NetworkCircuitBreakerException(
+                        f"Circuit breaker: {self.consecutive_failures} consecutive transient failures"
+                    )
+            else:
+                self.consecutive_failures = 0
 
         return response, classification, error_msg 
\ No newline at end of file
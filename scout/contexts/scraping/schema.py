@@ -10,6 +10,7 @@ Scraping decides how to meet them.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 from dotenv import load_dotenv
@@ -17,7 +18,21 @@ from omegaconf import OmegaConf
 
 # Load environment variables
 load_dotenv()
-CONFIG_PATH = Path(os.getenv("CONFIG_PATH"))
+CONFIG_PATH = Path(os.getenv("CONFIG_PATH", "config"))
+
+
+@lru_cache(maxsize=4)
+def _load_schema(schema_path: str, mtime_ns: int):
+    """
+    Parse a schema YAML file, memoized by resolved path and modification time.
+
+    Every scraper builds a CanonicalSchema, so the YAML is parsed once per process rather than
+    once per scraper; an edited file has a new mtime and is parsed again. The config is shared
+    between instances, so it is made read-only.
+    """
+    schema = OmegaConf.load(schema_path)
+    OmegaConf.set_readonly(schema, True)
+    return schema
 
 
 class CanonicalSchema:
@@ -35,7 +50,8 @@ class CanonicalSchema:
         Args:
             schema_path: Path to canonical schema YAML file (default: from CONFIG_PATH env var)
         """
-        self.schema = OmegaConf.load(schema_path)
+        schema_path = Path(schema_path).resolve()
+        self.schema = _load_schema(str(schema_path), schema_path.stat().st_mtime_ns)
         self.canonical = self.schema.canonical_schema
 
     def get_canonical_fields(self) -> List[str]:
@@ -8,7 +8,10 @@ import os
 import pandas as pd
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Union
 from dotenv import load_dotenv
+from sqlalchemy import create_engine
 
 # Load environment variables from .env file
 load_dotenv()
@@ -49,6 +52,18 @@ class DatabaseConfig:
         return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
+@lru_cache(maxsize=16)
+def _get_engine(connection_string: str, engine_options: tuple):
+    """
+    SQLAlchemy engine (and its connection pool) for a database, one per process.
+
+    Wrappers and scrapers pointed at the same database share it, so connections are checked
+    out of one pool instead of each caller opening (and authenticating) its own.
+    engine_options is a sorted tuple of create_engine() keyword items (hashable cache key).
+    """
+    return create_engine(connection_string, pool_pre_ping=True, **dict(engine_options))
+
+
 class DatabaseWrapper(ABC):
     """
     Abstract base class for database operations.
@@ -56,6 +71,15 @@ class DatabaseWrapper(ABC):
     Provides a common interface for different database backends (PostgreSQL, MySQL, etc.)
     """
 
+    # DataFrame.to_sql(method=...) used for bulk inserts; backends override with a native
+    # bulk loader (e.g. COPY), the default batches rows into multi-row INSERTs
+    to_sql_method = "multi"
+    # Rows per to_sql_method call (bounds the size of a single multi-row INSERT statement)
+    to_sql_chunksize = 10_000
+    # Extra create_engine() options for the scraper's SQLAlchemy engine; backends set their
+    # driver's batched-executemany switch here (e.g. fast_executemany=True for mssql+pyodbc)
+    engine_options = {}
+
     def __init__(self, config: DatabaseConfig):
         """
         Initialize database wrapper.
@@ -65,23 +89,33 @@ class DatabaseWrapper(ABC):
         """
         self.config = config
 
+    @property
+    def engine(self):
+        """
+        Process-wide SQLAlchemy engine for this database (created on first use, see _get_engine()).
+
+        pool_pre_ping replaces connections the server dropped while they sat in the pool.
+        """
+        return _get_engine(self.config.connection_string, tuple(sorted(self.engine_options.items())))
+
     @abstractmethod
     def connect(self):
         """Create and return a database connection."""
         pass
 
     @abstractmethod
-    def _query(self, query):
+    def _query(self, query, params=None):
         pass    
 
     @abstractmethod
-    def get_column_values(self, table_name: str, column_name: str) -> list:
+    def get_column_values(self, table_name: str, column_name: str, distinct: bool = False) -> list:
         """
         Get all values from a specific column in a table.
 
         Args:
             table_name: Name of the table
             column_name: Name of the column
+            distinct: If True, return each value once (deduplicated by the database)
 
         Returns:
             List of column values
@@ -89,15 +123,48 @@ class DatabaseWrapper(ABC):
         pass
 
     @abstractmethod
-    def export_df(self, query: str = None) -> pd.DataFrame:
+    def get_matching_column_values(self, table_name: str, column_name: str, values: list) -> list:
+        """
+        Get the given values that occur in a specific column of a table (each at most once).
+
+        The membership check runs in the database, so only matches are sent back.
+        """
+        pass
+
+    @abstractmethod
+    def count_column_values(self, table_name: str, column_name: str, distinct: bool = False) -> int:
+        """Count the non-null values (or only the distinct ones) in a specific column of a table."""
+        pass
+
+    @abstractmethod
+    def count_matching_column_values(self, table_name: str, column_name: str, values: list) -> int:
+        """Count how many of the given values occur in a specific column of a table (each at most once)."""
+        pass
+
+    @abstractmethod
+    def count_rows(self, table: str = None) -> int:
+        """
+        Count the rows of a table server-side (default: the configured table).
+
+        Returns 0 if the table doesn't exist yet (e.g. before the first append creates it).
+        """
+        pass
+
+    @abstractmethod
+    def export_df(
+        self, query: str = None, params: dict = None, chunksize: int = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Execute a query and return results as a pandas DataFrame.
 
         Args:
-            query: SQL query string (default: SELECT * from listings)
+            query: SQL query string (default: SELECT * from the configured table)
+            params: Parameters bound to placeholders in query (never interpolated as text)
+            chunksize: If given, return an iterator of DataFrames of at most this many rows
+                       instead of one DataFrame (bounds memory for large results)
 
         Returns:
-            DataFrame with query results
+            DataFrame with query results (or iterator of DataFrames, if chunksize is given)
         """
         pass
 
@@ -111,6 +178,23 @@ class DatabaseWrapper(ABC):
         """
         pass
 
+    def execute_many(self, cursor, query: str, params_seq: list) -> None:
+        """
+        Execute query once per parameter set on cursor (DB-API executemany by default).
+
+        Backends override this with their driver's batched execution helper, if it has one.
+        """
+        cursor.executemany(query, params_seq)
+
+    @abstractmethod
+    def ensure_index_exists(self, table: str, column: str) -> None:
+        """
+        Create an index on table(column) if it doesn't exist (idempotent).
+
+        Should do nothing if the table itself doesn't exist yet.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def _db_exists(config: DatabaseConfig) -> bool:
@@ -1,6 +1,5 @@
 """Minimal event logger for schema migrations written to JSON Lines."""
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +7,8 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+from scout.utils.helpers import json_dumps_bytes
+
 load_dotenv()
 LOGS_PATH = Path(os.getenv("LOGS_PATH", "outs/logs"))
 
@@ -36,6 +37,6 @@ def log_schema_migration_event(
         "rows_affected": rows_affected,
     }
 
-    # Keep one JSON object per line so downstream tools can stream the file.
-    with open(log_dir / "schema_migrations.txt", "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload) + "\n")
+    # Keep one JSON object per line so downstream tools can stream the file (already UTF-8 bytes).
+    with open(log_dir / "schema_migrations.txt", "ab") as handle:
+        handle.write(json_dumps_bytes(payload) + b"\n")
@@ -58,33 +58,35 @@ def process_status_events_for_database(
             print(f"No active event log found at {active_log} .")
         return 0
 
-    # Read all events from active log
-    with open(active_log, "r") as f:
-        lines = f.readlines()
-
-    if not lines:
-        if verbose:
-            print("No events to process.")
-        return 0
-
-    # Parse and filter events
-    all_events = [] # TODO: Should implement a more efficient way of handling multi-database event processing than reading every event for every database
+    # Parse and filter events in one streaming pass over the active log (no list of every line);
+    # only events for other databases keep their raw line, to be written back afterwards
+    # TODO: Should implement a more efficient way of handling multi-database event processing than reading every event for every database
     events_for_this_db = []
+    events_to_keep = []  # Raw lines of events for other databases (not processed)
     malformed_lines = []
+    log_is_empty = True
 
-    for line in lines:
-        try:
-            event = json.loads(line.strip())
-            all_events.append((line, event))
+    with open(active_log, "r") as f:
+        for line in f:
+            log_is_empty = False
+            try:
+                event = json.loads(line)
 
-            # Filter to only this database
-            if event["database"] == database_name:
-                events_for_this_db.append(event)
+                # Filter to only this database
+                if event["database"] == database_name:
+                    events_for_this_db.append(event)
+                else:
+                    events_to_keep.append(line)
 
-        except json.JSONDecodeError as e:
-            if verbose:
-                print(f"Skipping malformed event: {line.strip()} (error: {e})")
-            malformed_lines.append(line)
+            except json.JSONDecodeError as e:
+                if verbose:
+                    print(f"Skipping malformed event: {line.strip()} (error: {e})")
+                malformed_lines.append(line)
+
+    if log_is_empty:
+        if verbose:
+            print("No events to process.")
+        return 0
 
     if not events_for_this_db:
         if verbose:
@@ -100,19 +102,19 @@ def process_status_events_for_database(
 
     # Begin transaction
     try:
-        events_processed = 0
-        for event in events_for_this_db:
-            url = event["url"]
-            new_status = event["new_status"]
-            timestamp = event["timestamp"]
+        status_updates = [
+            (event["new_status"], event["timestamp"], event["url"])
+            for event in events_for_this_db
+        ]
 
-            # %s placeholders prevent SQL injection
-            cursor.execute(
-                f"UPDATE {table} SET status = %s, last_checked = %s WHERE url = %s",
-                (new_status, timestamp, url)
-            )
+        # %s placeholders prevent SQL injection; updates are sent in batches, not one per round trip
+        db_wrapper.execute_many(
+            cursor,
+            f"UPDATE {table} SET status = %s, last_checked = %s WHERE url = %s",
+            status_updates,
+        )
 
-            events_processed += 1
+        events_processed = len(status_updates)
 
         # Make all changes to the database permenant at once updates above are applied together.
         # If an error occurs before this during the transaction, no events are are updated.
@@ -141,11 +143,6 @@ def process_status_events_for_database(
         # Rewrite active log with:
         # - Events for other databases (not processed)
         # - Malformed events (also not processed, for manual review)
-        events_to_keep = [
-            raw_line for raw_line, event in all_events
-            if event.get("database") != database_name
-        ]
-
         with open(active_log, "w") as f:
             f.writelines(events_to_keep + malformed_lines)
 
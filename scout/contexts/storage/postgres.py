@@ -7,11 +7,14 @@ Provides PostgreSQL-specific utilities:
 - PostgreSQL implementation of SchemaInspector
 """
 
+import io
+
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extras import execute_batch, execute_values
 import pandas as pd
 import warnings
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Union
 
 from scout.contexts.storage.database import DatabaseWrapper as BaseDBWrapper, DatabaseConfig
 from scout.contexts.storage.schema import SchemaInspector
@@ -29,6 +32,69 @@ def postgres_connect(config: DatabaseConfig, name: str = None, host: str = None,
     )
 
 
+def _copy_csv_field(value) -> str:
+    """
+    Render value as one field of the CSV fed to COPY.
+
+    None is an unquoted empty field, which is NULL in COPY's CSV format. Every other value is
+    quoted, so it is never read as NULL: "" stays an empty string and "\\N" stays "\\N" (quoting
+    doesn't stop non-text columns from parsing their value as usual).
+    Integral floats are written without their ".0": pandas turns an integer column with a
+    missing value into float64, and COPY (unlike INSERT) won't cast "150000.0" to an integer.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """
+    Bulk-insert rows with COPY FROM STDIN (usable as DataFrame.to_sql(method=...)).
+
+    Streams the rows as CSV in one round trip instead of issuing an INSERT per row.
+    Only None loads as NULL (see _copy_csv_field), so every string round-trips unchanged.
+    """
+    buffer = io.StringIO()
+    for row in data_iter:
+        buffer.write(",".join(_copy_csv_field(value) for value in row) + "\n")
+    buffer.seek(0)
+
+    if table.schema:
+        table_identifier = sql.Identifier(table.schema, table.name)
+    else:
+        table_identifier = sql.Identifier(table.name)
+
+    copy_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        table_identifier, sql.SQL(", ").join(map(sql.Identifier, keys))
+    )
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(copy_query, buffer)
+
+
+def psql_insert_values(table, conn, keys, data_iter, page_size=1000):
+    """
+    Bulk-insert rows with multi-row INSERT ... VALUES pages (usable as DataFrame.to_sql(method=...)).
+
+    Fallback for when COPY can't be used (e.g. the insert needs an ON CONFLICT clause, or goes
+    through a connection pooler that doesn't support COPY). psycopg2's execute_values sends
+    page_size rows per statement, instead of the one round trip per row of executemany.
+    """
+    if table.schema:
+        table_identifier = sql.Identifier(table.schema, table.name)
+    else:
+        table_identifier = sql.Identifier(table.name)
+
+    insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        table_identifier, sql.SQL(", ").join(map(sql.Identifier, keys))
+    )
+
+    with conn.connection.cursor() as cursor:
+        execute_values(cursor, insert_query.as_string(cursor), data_iter, page_size=page_size)
+
+
 class PostgreSQLWrapper(BaseDBWrapper):
     """
     PostgreSQL implementation of DatabaseWrapper.
@@ -36,45 +102,147 @@ class PostgreSQLWrapper(BaseDBWrapper):
     Provides connection management and common query patterns for PostgreSQL.
     """
 
+    # Set to staticmethod(psql_insert_values) (e.g. in a subclass) where COPY isn't usable
+    to_sql_method = staticmethod(psql_insert_copy)
+    to_sql_chunksize = None  # COPY streams any number of rows, so a batch is loaded in one call
+    # Any executemany through the engine is batched by psycopg2 (VALUES pages for INSERTs,
+    # execute_batch for UPDATE/DELETE) instead of run row by row
+    engine_options = {
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 10_000,
+        "executemany_batch_page_size": 500,
+    }
+
     def __init__(self, config: DatabaseConfig):
         super().__init__(config)
 
     def connect(self):
-        """Create a new PostgreSQL database connection."""
-        return postgres_connect(self.config)
+        """
+        Check out a psycopg2 connection from the database's shared connection pool.
+
+        It behaves like a plain psycopg2 connection, except that close() hands it back to the
+        pool (uncommitted work is rolled back) instead of disconnecting, so the next call skips
+        the connection setup and authentication round trips.
+        """
+        return self.engine.raw_connection()
+
+    def _query(self, query, params=None):
+        """
+        Execute a query and return first column values.
 
-    def _query(self, query):
-        """Execute a query and return first column values."""
+        Uses a server-side (named) cursor, so rows stream over in batches of cursor.itersize
+        instead of the full result being buffered client-side before conversion.
+        """
         conn = self.connect()
-        cur = conn.cursor()
-        cur.execute(query)
-        values = cur.fetchall()
+        cur = conn.cursor(name="scout_query")
+        cur.execute(query, params)
+        values = [row[0] for row in cur]
         cur.close()
         conn.close()
-        return [val[0] for val in values]
+        return values
 
-    def get_column_values(self, table_name: str, column_name: str) -> list:
-        """Get all values from a specific column in a table."""
-        all_values_query = sql.SQL("SELECT {} FROM {};").format(
-            sql.Identifier(column_name), sql.Identifier(table_name)
+    def execute_many(self, cursor, query: str, params_seq: list, page_size: int = 500) -> None:
+        """
+        Execute query once per parameter set, sending page_size statements per round trip.
+
+        psycopg2's executemany() issues one round trip per parameter set; execute_batch joins
+        them into a few multi-statement requests instead.
+        """
+        execute_batch(cursor, query, params_seq, page_size=page_size)
+
+    def get_column_values(self, table_name: str, column_name: str, distinct: bool = False) -> list:
+        """Get all values (or only the distinct ones, deduplicated server-side) from a column in a table."""
+        all_values_query = sql.SQL("SELECT {}{} FROM {};").format(
+            sql.SQL("DISTINCT " if distinct else ""), sql.Identifier(column_name), sql.Identifier(table_name)
         )
         return self._query(all_values_query)
 
-    def export_df(self, query: str = None) -> pd.DataFrame:
-        """Execute a query and return results as a pandas DataFrame."""
+    def get_matching_column_values(self, table_name: str, column_name: str, values: list) -> list:
+        """Get the given values that occur in a column (one indexed = ANY(array) lookup)."""
+        matching_values_query = sql.SQL("SELECT DISTINCT {0} FROM {1} WHERE {0} = ANY(%s);").format(
+            sql.Identifier(column_name), sql.Identifier(table_name)
+        )
+        return self._query(matching_values_query, (list(values),))
+
+    def count_matching_column_values(self, table_name: str, column_name: str, values: list) -> int:
+        """Count the given values that occur in a column (one indexed = ANY(array) lookup, counted server-side)."""
+        count_query = sql.SQL("SELECT COUNT(DISTINCT {0}) FROM {1} WHERE {0} = ANY(%s);").format(
+            sql.Identifier(column_name), sql.Identifier(table_name)
+        )
+        return self._query(count_query, (list(values),))[0]
+
+    def count_column_values(self, table_name: str, column_name: str, distinct: bool = False) -> int:
+        """Count the non-null values (or only the distinct ones) in a column, server-side."""
+        count_query = sql.SQL("SELECT COUNT({}{}) FROM {};").format(
+            sql.SQL("DISTINCT " if distinct else ""), sql.Identifier(column_name), sql.Identifier(table_name)
+        )
+        return self._query(count_query)[0]
+
+    def count_rows(self, table: str = None) -> int:
+        """Count the rows of a table (default: the configured table) with one COUNT(*) query."""
+        table = table if table is not None else self.config.table
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT to_regclass(%s)", (table,))
+        if cursor.fetchone()[0] is None:
+            row_count = 0
+        else:
+            cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table)))
+            row_count = cursor.fetchone()[0]
+
+        cursor.close()
+        conn.close()
+        return row_count
+
+    def export_df(
+        self, query: str = None, params: dict = None, chunksize: int = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Execute a query and return results as a pandas DataFrame.
+
+        With chunksize, returns an iterator of DataFrames of at most chunksize rows instead
+        (the connection is closed once the iterator is exhausted or discarded).
+        """
+        query = query if query is not None else f"SELECT * from {self.config.table}"
+        if chunksize is not None:
+            return self._export_df_chunks(query, params, chunksize)
+
+        conn = self.connect()
+        df = self._read_sql_query(query, conn, params)
+        conn.close()
+        return df
+
+    def _export_df_chunks(self, query, params, chunksize) -> Iterator[pd.DataFrame]:
+        """
+        Yield query results chunksize rows at a time from a server-side (named) cursor.
+
+        pd.read_sql_query(chunksize=...) on a plain psycopg2 cursor still receives the whole
+        result client-side before slicing it; here only one chunk is held at a time.
+        """
         conn = self.connect()
-        query = query if query is not None else "SELECT * from listings"
+        try:
+            with conn.cursor(name="scout_export") as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchmany(chunksize)
+                columns = [column.name for column in cursor.description]
+                # An empty result still gives one (empty) chunk, as pd.read_sql_query does
+                yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                while rows := cursor.fetchmany(chunksize):
+                    yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        finally:
+            conn.close()
 
+    @staticmethod
+    def _read_sql_query(query, conn, params):
         # Suppress pandas warning about using raw psycopg2 connection
         # Note: pandas recommends SQLAlchemy, but it has bugs with filtered queries
         # (see notebooks/debug_pandas_warning.ipynb for investigation)
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', message='.*SQLAlchemy.*')
             warnings.filterwarnings('ignore', message='.*DBAPI2.*')
-            df = pd.read_sql_query(query, conn)
-
-        conn.close()
-        return df
+            return pd.read_sql_query(query, conn, params=params)
 
     def ensure_column_exists(self, table: str, column: str, datatype: str) -> None:
         """
@@ -133,6 +301,30 @@ class PostgreSQLWrapper(BaseDBWrapper):
         cursor.close()
         conn.close()
 
+    def ensure_index_exists(self, table: str, column: str) -> None:
+        """
+        Create an index on table(column) if it doesn't already exist (idempotent).
+
+        Does nothing if the table doesn't exist yet (e.g. before the first append creates it).
+
+        Example:
+            >>> db.ensure_index_exists("listings", "url")
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT to_regclass(%s)", (table,))
+        if cursor.fetchone()[0] is not None:
+            cursor.execute(
+                sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} ({})").format(
+                    sql.Identifier(f"idx_{table}_{column}"), sql.Identifier(table), sql.Identifier(column)
+                )
+            )
+            conn.commit()
+
+        cursor.close()
+        conn.close()
+
     @staticmethod
     def _db_exists(config: DatabaseConfig) -> bool:
         """
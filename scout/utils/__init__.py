@@ -3,7 +3,7 @@ Shared utility functions.
 """
 
 from scout.utils.config_helpers import merge_configs
-from scout.utils.helpers import flatten_dict, relative_to_project
+from scout.utils.helpers import flatten_dict, json_dumps_bytes, json_loads, relative_to_project, use_arrow_strings
 from scout.utils.text_processing import (
     check_keyword_between_delimiters,
     truncate_between_substrings,
@@ -15,6 +15,9 @@ __all__ = [
     # Misc utilities
     "relative_to_project",
     "flatten_dict",
+    "json_dumps_bytes",
+    "json_loads",
+    "use_arrow_strings",
     # Text processing
     "check_keyword_between_delimiters",
     "truncate_between_substrings",
@@ -4,13 +4,25 @@ General utility functions for SCOUT.
 Contains helper functions used across different modules.
 """
 
+import json
 import os
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
+import pandas as pd
 from dotenv import load_dotenv
 import collections.abc
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install -e ".[speedups]"
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional speedup: pip install -e ".[speedups]"
+    pyarrow = None
+
 # Load environment variables
 load_dotenv()
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", "."))
@@ -86,3 +98,48 @@ def relative_to_project(path: Union[str, Path]) -> str:
 
     # Remove project root part of path to make it relative
     return path.replace(proj_root_str + "/", "")
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes.
+
+    Uses orjson (Rust encoder, emits bytes directly) when installed, otherwise the standard
+    library encoder with matching output (compact separators, non-ASCII kept as UTF-8).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Uses orjson when installed, otherwise the standard library parser. Malformed input, including
+    bytes that aren't valid UTF-8, raises json.JSONDecodeError either way (orjson's error type
+    subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:  # What the standard library raises for invalid UTF-8
+        raise json.JSONDecodeError(f"Invalid UTF-8 ({e.reason})", data.decode("utf-8", "replace"), e.start) from e
+
+
+def use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the text columns of df as Arrow-backed strings, in place.
+
+    Object columns holding only strings (and missing values) keep one Python object per cell;
+    Arrow strings pack them into contiguous buffers, which is several times smaller for wide
+    text columns like descriptions. Returns df unchanged when pyarrow isn't installed.
+    """
+    if pyarrow is None:
+        return df
+
+    for column in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[column], skipna=True) == "string":
+            df[column] = df[column].astype("string[pyarrow]")
+    return df
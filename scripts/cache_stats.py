@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Display statistics for JSON cache files.
+Display statistics for JSON cache files (plain or zstd-compressed).
 
 This script analyzes cache files in the data/cache directory and shows:
 - Total URLs per cache file
@@ -8,14 +8,22 @@ This script analyzes cache files in the data/cache directory and shows:
 - Aggregate totals across all cache files
 """
 
-import json
+import os
 from pathlib import Path
 
+from scout.contexts.scraping.base import _cache_journal_path, _read_cache_file, _read_cache_journal
+
 
 def get_cache_stats(cache_file_path):
-    """Extract statistics from a single cache file."""
-    with open(cache_file_path) as f:
-        data = json.load(f)
+    """Extract statistics from a single cache file (plain .json or zstd-compressed .json.zst)."""
+    cache_file_stat = os.stat(cache_file_path)
+    # Copied: _read_cache_file's result is shared with other readers
+    data = dict(_read_cache_file(cache_file_path, cache_file_stat.st_mtime_ns, cache_file_stat.st_size))
+
+    # Fold in updates journaled since the last full export (later lines win)
+    journal_path = _cache_journal_path(cache_file_path)
+    if os.path.exists(journal_path):
+        data.update(_read_cache_journal(journal_path)[0])
 
     total = len(data)
     success = sum(1 for v in data.values() if v.get('status') == 'success')
@@ -33,7 +41,7 @@ def get_cache_stats(cache_file_path):
 def main():
     """Display cache statistics for all JSON files."""
     cache_dir = Path('data/cache')
-    cache_files = sorted(cache_dir.glob('*.json'))
+    cache_files = sorted([*cache_dir.glob('*.json'), *cache_dir.glob('*.json.zst')])
 
     if not cache_files:
         print("No cache files found in data/cache/")
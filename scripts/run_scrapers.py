@@ -62,6 +62,13 @@ def run_command(
         help="Max listings to scrape per iteration (default: all pending)",
         min=1,
     ),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        "-j",
+        help="Number of scrapers to run at once (default: 1, one after another)",
+        min=1,
+    ),
 ):
     """
     Run job scrapers with logging to timestamped files.
@@ -84,6 +91,9 @@ def run_command(
 
         # Start from a specific page (useful for testing)
         $ run_scrapers.py run MomCorpScraper --start-page 30
+
+        # Run all scrapers, three sites at a time
+        $ run_scrapers.py run --parallel 3
     """
     # None or empty list -> run all scrapers
     scraper_names = scrapers if scrapers else None
@@ -118,6 +128,7 @@ def run_command(
             scraper_names=scraper_names,
             verbose=not quiet,
             scraper_kwargs=scraper_kwargs,
+            max_parallel=parallel,
         )
 
         # Exit with error code if any scrapers failed
@@ -0,0 +1,55 @@
+"""Fixtures for scraping tests: scrapers backed by an in-memory archive instead of a database."""
+
+from types import SimpleNamespace
+
+import pytest
+from omegaconf import OmegaConf
+
+from scout.contexts.scraping.base import JobListingScraper
+
+
+class FakeArchiveDB:
+    """The DatabaseWrapper queries scrapers make about their archive, answered from a list of URLs."""
+
+    def __init__(self, urls=()):
+        self.urls = list(urls)
+
+    def get_column_values(self, table_name, column_name, distinct=False):
+        return list(dict.fromkeys(self.urls)) if distinct else list(self.urls)
+
+    def get_matching_column_values(self, table_name, column_name, values):
+        archived = set(self.urls)
+        return [value for value in dict.fromkeys(values) if value in archived]
+
+    def count_column_values(self, table_name, column_name, distinct=False):
+        return len(set(self.urls)) if distinct else len(self.urls)
+
+    def count_matching_column_values(self, table_name, column_name, values):
+        return len(set(self.urls) & set(values))
+
+
+class StubScraper(JobListingScraper):
+    """JobListingScraper whose archive is a FakeArchiveDB (nothing is fetched)."""
+
+    def __init__(self, cache_path, archived_urls=()):
+        self.fetch_config = OmegaConf.create({"batch_delay": 0})
+        self.url_col_name = "url"
+        self.df2db_col_map = {"url": "url"}
+        self.db2df_col_map = {"url": "url"}
+        self.listing_scraping_completed = False
+        self.db_config = SimpleNamespace(table="listings")
+        self.db = FakeArchiveDB(archived_urls)
+        self._load_cache(cache_path)
+
+    def fetch_next_batch(self, batch_size, retry_failures=False, listing_batch_size=None):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def make_scraper(tmp_path):
+    """Build a StubScraper on a cache file in tmp_path (default name: cache.json)."""
+
+    def make(archived_urls=(), cache_name="cache.json"):
+        return StubScraper(tmp_path / cache_name, archived_urls)
+
+    return make
@@ -0,0 +1,76 @@
+"""Tests for the scraper's URL status cache: cache file, journal and archive reconciliation."""
+
+import json
+import os
+
+import pytest
+
+from scout.contexts.scraping.base import SUCCESS_STATUS, TEMP_STATUS
+from scout.utils import helpers
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(status):
+    return {"status": status, "attempts": 1, "last_attempt": None}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_journal_torn_inside_multibyte_character_is_skipped(make_scraper, monkeypatch, use_orjson):
+    if not use_orjson:  # The standard library raises UnicodeDecodeError here, not JSONDecodeError
+        monkeypatch.setattr(helpers, "orjson", None)
+    scraper = make_scraper()
+    scraper._update_cache({"https://example.com/a": _entry(TEMP_STATUS)})
+    scraper._export_cache()
+
+    journal_path = scraper.cache_journal_path
+    torn_line = json.dumps({"url": "https://example.com/café", **_entry(TEMP_STATUS)}, ensure_ascii=False)
+    torn_bytes = torn_line.encode("utf-8")
+    with open(journal_path, "ab") as f:
+        f.write(torn_bytes[: torn_bytes.index("é".encode("utf-8")) + 1])  # Cut between é's two bytes
+
+    reloaded = make_scraper()
+
+    assert reloaded.cache == {"https://example.com/a": _entry(TEMP_STATUS)}
+    assert not os.path.exists(journal_path)  # Compacted, so later appends start on a fresh file
+
+
+def test_journal_lines_that_are_not_entries_are_skipped(make_scraper):
+    scraper = make_scraper()
+    scraper._update_cache({"https://example.com/a": _entry(SUCCESS_STATUS)})
+    scraper._export_cache()
+
+    with open(scraper.cache_journal_path, "a", encoding="utf-8") as f:
+        f.write('[1, 2]\n{"status": "pending"}\n')
+
+    assert make_scraper().cache == {"https://example.com/a": _entry(SUCCESS_STATUS)}
+
+
+def test_archived_url_is_found_when_counts_match_by_coincidence(make_scraper):
+    make_scraper(archived_urls=["https://example.com/a", "https://example.com/b"])._export_cache()
+
+    # b was deleted from the table and c archived by another process: still two archived URLs
+    scraper = make_scraper(archived_urls=["https://example.com/a", "https://example.com/c"])
+
+    assert scraper.cache["https://example.com/c"]["status"] == SUCCESS_STATUS
+
+
+@pytest.mark.parametrize("damage", ["corrupt", "truncated"])
+def test_damaged_compressed_cache_is_refreshed_from_archive(make_scraper, damage):
+    pytest.importorskip("zstandard")
+    scraper = make_scraper(archived_urls=["https://example.com/a"], cache_name="cache.json.zst")
+    scraper._update_cache({"https://example.com/b": _entry(TEMP_STATUS)})
+    scraper._export_full_cache()
+
+    with open(scraper.cache_path, "rb") as f:
+        content = f.read()
+    if damage == "corrupt":
+        content = content[:4] + b"\xff" * (len(content) - 4)  # Frame magic, then garbage (ZstdError)
+    else:
+        content = content[: len(content) // 2]
+    with open(scraper.cache_path, "wb") as f:
+        f.write(content)
+
+    reloaded = make_scraper(archived_urls=["https://example.com/a"], cache_name="cache.json.zst")
+
+    assert reloaded.cache == {"https://example.com/a": _entry(SUCCESS_STATUS)}
@@ -0,0 +1,99 @@
+"""Tests for the COPY-based bulk insert (psql_insert_copy)."""
+
+import os
+
+import pandas as pd
+import psycopg2
+import pytest
+
+from scout.contexts.storage.database import DatabaseConfig
+from scout.contexts.storage.postgres import postgres_connect, psql_insert_copy
+
+
+class _CapturingCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def copy_expert(self, query, buffer):
+        self.query = query
+        self.data = buffer.read()
+
+
+class _Table:
+    schema = None
+    name = "listings"
+
+
+def _copy_csv(rows):
+    cursor = _CapturingCursor()
+    conn = type("Conn", (), {"connection": type("Raw", (), {"cursor": lambda self: cursor})()})()
+    psql_insert_copy(_Table(), conn, ["a", "b"], iter(rows))
+    return cursor.data
+
+
+def _parse_copy_csv(data):
+    """Split CSV the way COPY ... (FORMAT csv) reads it: only unquoted empty fields are NULL."""
+    rows = []
+    for line in data.splitlines():
+        fields, field, quoted, in_quotes, i = [], "", False, False, 0
+        while i < len(line):
+            char = line[i]
+            if in_quotes:
+                if char == '"' and line[i + 1 : i + 2] == '"':
+                    field += '"'
+                    i += 1
+                elif char == '"':
+                    in_quotes = False
+                else:
+                    field += char
+            elif char == '"':
+                in_quotes = quoted = True
+            elif char == ",":
+                fields.append(field if quoted or field else None)
+                field, quoted = "", False
+            else:
+                field += char
+            i += 1
+        fields.append(field if quoted or field else None)
+        rows.append(tuple(fields))
+    return rows
+
+
+@pytest.mark.unit
+def test_copy_csv_keeps_null_empty_and_backslash_n_apart():
+    rows = [(None, ""), ("\\N", 'say "hi", ok')]
+
+    assert _parse_copy_csv(_copy_csv(rows)) == rows
+
+
+@pytest.mark.unit
+def test_copy_csv_writes_integral_floats_as_integers():
+    assert _parse_copy_csv(_copy_csv([(150000.0, 1.5)])) == [("150000", "1.5")]
+
+
+def _test_database_config():
+    try:
+        config = DatabaseConfig.from_env(name=os.getenv("POSTGRES_DB", "postgres"), table="copy_round_trip")
+        postgres_connect(config).close()
+    except (TypeError, psycopg2.OperationalError):
+        pytest.skip("PostgreSQL is not reachable")
+    return config
+
+
+@pytest.mark.integration
+@pytest.mark.database
+def test_copy_round_trip_through_postgres():
+    config = _test_database_config()
+    conn = postgres_connect(config)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("CREATE TEMP TABLE listings (a TEXT, b INTEGER)")
+            raw = type("Conn", (), {"connection": conn})()
+            psql_insert_copy(_Table(), raw, ["a", "b"], iter([(None, None), ("", 150000.0), ("\\N", 2)]))
+            cursor.execute("SELECT a, b FROM listings")
+            assert cursor.fetchall() == [(None, None), ("", 150000), ("\\N", 2)]
+    finally:
+        conn.close()
@@ -0,0 +1,31 @@
+"""Tests for the shared helpers in scout.utils.helpers."""
+
+import json
+
+import pytest
+
+from scout.utils import helpers
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (if installed) and with the standard library fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(helpers, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("data", [b'{"url": "caf\xc3', b'{"url": "\xff"}', b'{"url": '])
+def test_json_loads_raises_json_decode_error_for_malformed_input(json_backend, data):
+    with pytest.raises(json.JSONDecodeError):
+        helpers.json_loads(data)
+
+
+def test_json_loads_round_trips_json_dumps_bytes(json_backend):
+    obj = {"url": "https://example.com/café", "attempts": 1, "last_attempt": None}
+
+    assert helpers.json_loads(helpers.json_dumps_bytes(obj)) == obj